@@ -1,32 +1,133 @@
 # import external modules here
 import os
 import sys
+import asyncio
 import logging
 import pythoncom
+import win32event
 import win32com.client
-from typing import Union
-from datetime import datetime
+from typing import NamedTuple, Union
+from collections import OrderedDict
+from collections.abc import Mapping
 from time import sleep as wait
+from time import monotonic
 
 # import internal modules here
 from .py_canoe_logger import PyCanoeLogger
 
 
+class CanoeCanBusStatistics(NamedTuple):
+    """CAN bus statistics snapshot returned by CANoe.get_can_bus_statistics_info.
+    use _asdict() to get the same dict as CANoe.get_can_bus_statistics.
+    """
+    bus_load: float
+    chip_state: int
+    error: float
+    error_total: int
+    extended: float
+    extended_total: int
+    extended_remote: float
+    extended_remote_total: int
+    overload: float
+    overload_total: int
+    peak_load: float
+    rx_error_count: int
+    standard: float
+    standard_total: int
+    standard_remote: float
+    standard_remote_total: int
+    tx_error_count: int
+
+    # BusStatistic COM property for each field, in field order.
+    COM_PROPERTY_NAMES = ('BusLoad', 'ChipState', 'Error', 'ErrorTotal', 'Extended', 'ExtendedTotal', 'ExtendedRemote',
+                          'ExtendedRemoteTotal', 'Overload', 'OverloadTotal', 'PeakLoad', 'RxErrorCount', 'Standard',
+                          'StandardTotal', 'StandardRemote', 'StandardRemoteTotal', 'TxErrorCount')
+
+
+class LazyCOMMapping(Mapping):
+    """Read only mapping that is filled on demand from an iterable of (name, object) pairs.
+    COM collections are only walked as far as needed to find the requested name.
+    """
+    __slots__ = ('__items', '__source')
+
+    def __init__(self, source):
+        self.__items = dict()
+        self.__source = iter(source)
+
+    def __load_next(self) -> bool:
+        if self.__source is None:
+            return False
+        for name, obj in self.__source:
+            self.__items.setdefault(name, obj)
+            return True
+        self.__source = None
+        return False
+
+    def __getitem__(self, key):
+        while key not in self.__items:
+            if not self.__load_next():
+                raise KeyError(key)
+        return self.__items[key]
+
+    def __iter__(self):
+        while self.__load_next():
+            pass
+        return iter(self.__items)
+
+    def __len__(self) -> int:
+        while self.__load_next():
+            pass
+        return len(self.__items)
+
+
 class CANoe:
     """
     Represents a CANoe instance.
     Args:
-        py_canoe_log_dir (str): The path for the CANoe log file. Defaults to an empty string.
+        py_canoe_log_dir (str): The path for the CANoe log file. Defaults to an empty string (PY_CANOE_LOG_DIR environment variable is used if set).
         user_capl_functions (tuple): A tuple of user-defined CAPL function names. Defaults to an empty tuple.
+        early_binding (bool): True to use makepy generated (early bound) COM wrappers. Defaults to False.
+        py_canoe_log_console (bool): True to print log messages in console. Defaults to True.
     """
+    __slots__ = (
+        '__log', '__log_debug_enabled', '__user_capl_functions', '__early_binding', '__version_info', '__opened_cfg_info', '__com_initialized',
+        '__diag_devices_cache', '__simulation_setup_cache', '__test_setup_cache', '__replay_blocks_cache', '__test_setup_environments_cache', '__test_modules_cache', '__test_modules_by_name_cache', '__bus_objs', '__get_bus_com_method', '__bus_statistic_objs', '__bus_statistic_dispids', '__signal_objs', '__j1939_signal_objs',
+        '__diag_request_pool', '__diag_request_pool_measurement', '__diag_response_dispids', '__env_var_objs', '__sys_var_objs', '__sys_var_array_infos', '__namespace_objs', '__bus_databases_infos', '__write_window_buffer', '__write_window_disabled_output_tabs',
+        'application_events_enabled', 'application_open_close_timeout', 'simulation_events_enabled',
+        'measurement_events_enabled', 'measurement_start_stop_timeout', 'configuration_events_enabled',
+        'application_com_obj', 'wait_for_canoe_app_to_open', 'wait_for_canoe_app_to_close',
+        'bus_com_obj', 'bus_databases', 'bus_nodes', 'capl_obj',
+        'configuration_com_obj', 'configuration_offline_setup', 'configuration_offline_setup_source',
+        'configuration_offline_setup_source_sources', 'configuration_offline_setup_source_sources_paths',
+        'configuration_online_setup', 'configuration_online_setup_bus_statistics', 'configuration_online_setup_bus_statistics_bus_statistic',
+        'configuration_general_setup', 'configuration_simulation_setup', 'configuration_test_setup',
+        'environment_obj_inst', 'measurement_com_obj', 'wait_for_canoe_meas_to_start', 'wait_for_canoe_meas_to_stop',
+        'networks_com_obj', 'networks_obj', 'system_com_obj', 'system_obj', 'ui_com_obj', 'ui_write_window_com_obj', 'version_com_obj',
+    )
+    TEST_VERDICTS = {0: 'NotAvailable',
+                     1: 'Passed',
+                     2: 'Failed',
+                     3: 'None (not available for test modules)',
+                     4: 'Inconclusive (not available for test modules)',
+                     5: 'ErrorInTestSystem (not available for test modules)', }
+    BUS_TYPES = {'CAN': 1, 'J1939': 2, 'TTP': 4, 'LIN': 5, 'MOST': 6, 'Kline': 14}
+    DIAG_REQUEST_POOL_SIZE = 256
+    WRITE_WINDOW_BUFFER_SIZE = 64
+    CAPL_COMPILE_TIMEOUT = 1
+    CAPL_COMPILE_POLL_INTERVAL = 0.05
+    VERSION_INFO_LOG_TITLE = '> CANoe Application.Version ℹ️nfo<'.center(50, '➖')
+    LOG_SEPARATOR = ''.center(50, '➖')
     CANOE_APPLICATION_OPENED = False
     CANOE_APPLICATION_CLOSED = False
     CANOE_MEASUREMENT_STARTED = False
     CANOE_MEASUREMENT_STOPPED = False
+    # incremented on every measurement OnInit event. also counts measurements not started by py_canoe (GUI, CAPL, test modules).
+    CANOE_MEASUREMENT_INIT_COUNT = 0
 
-    def __init__(self, py_canoe_log_dir='', user_capl_functions=tuple()):
+    def __init__(self, py_canoe_log_dir='', user_capl_functions=tuple(), early_binding=False, py_canoe_log_console=True):
         try:
-            self.__log = PyCanoeLogger(py_canoe_log_dir).log
+            self.__log = PyCanoeLogger(py_canoe_log_dir, py_canoe_log_console).log
+            self.__log_debug_enabled = self.__log.isEnabledFor(logging.DEBUG)
             self.application_events_enabled = True
             self.application_open_close_timeout = 60
             self.simulation_events_enabled = False
@@ -34,17 +135,46 @@ class CANoe:
             self.measurement_start_stop_timeout = 60   # default value set to 60 seconds (1 minute)
             self.configuration_events_enabled = False
             self.__user_capl_functions = user_capl_functions
+            self.__early_binding = early_binding
+            self.__version_info = None
+            self.__opened_cfg_info = None
+            self.__com_initialized = False
+            self.__write_window_buffer = list()
+            self.__reset_configuration_caches()
         except Exception as e:
             self.__log.error(f'😡 Error initializing CANoe object: {str(e)}')
             sys.exit(1)
 
+    def refresh_log_level(self) -> None:
+        """Re-reads the CANOE_LOG logger level. call this after changing the logger level at runtime."""
+        self.__log_debug_enabled = self.__log.isEnabledFor(logging.DEBUG)
+
+    def __init_com_apartment(self):
+        if self.__com_initialized:
+            return
+        try:
+            pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+            self.__com_initialized = True
+        except pythoncom.com_error as e:
+            # thread is already initialized with a different apartment model. COM is usable as it is.
+            self.__log.debug(f'👉 COM already initialized for this thread: {str(e)}')
+
+    def __dispatch_canoe_application(self):
+        if self.__early_binding:
+            try:
+                # generates the makepy wrappers once (stored in the win32com gen_py cache). later Dispatch calls reuse them.
+                return win32com.client.gencache.EnsureDispatch('CANoe.Application')
+            except Exception as e:
+                self.__log.warning(f'⚠️ early binding not possible. using late binding. {str(e)}')
+        return win32com.client.Dispatch('CANoe.Application')
+
     def __init_canoe_application(self):
         try:
             self.__log.debug('➖'*50)
             wait(0.5)
-            pythoncom.CoInitialize()
+            self.__init_com_apartment()
             wait(0.5)
-            self.application_com_obj = win32com.client.Dispatch('CANoe.Application')
+            self.application_com_obj = self.__dispatch_canoe_application()
             self.wait_for_canoe_app_to_open = lambda: DoMeasurementEventsUntil(lambda: CANoe.CANOE_APPLICATION_OPENED, lambda: self.application_open_close_timeout)
             self.wait_for_canoe_app_to_close = lambda: DoMeasurementEventsUntil(lambda: CANoe.CANOE_APPLICATION_CLOSED, lambda: self.application_open_close_timeout)
             if self.application_events_enabled:
@@ -57,6 +187,9 @@ class CANoe:
     def __init_canoe_application_bus(self):
         try:
             self.bus_com_obj = win32com.client.Dispatch(self.application_com_obj.Bus)
+            # Application.Bus is the CAN bus. reuse it for the first CAN signal access instead of calling GetBus again.
+            self.__bus_objs.setdefault('CAN', self.bus_com_obj)
+            self.__get_bus_com_method = self.application_com_obj.GetBus
             self.bus_databases = win32com.client.Dispatch(self.bus_com_obj.Databases)
             self.bus_nodes = win32com.client.Dispatch(self.bus_com_obj.Nodes)
         except Exception as e:
@@ -79,23 +212,26 @@ class CANoe:
             self.configuration_offline_setup_source = win32com.client.Dispatch(self.configuration_offline_setup.Source)
             self.configuration_offline_setup_source_sources = win32com.client.Dispatch(self.configuration_offline_setup_source.Sources)
             sources = self.configuration_offline_setup_source_sources
-            sources_count = sources.Count + 1
-            self.configuration_offline_setup_source_sources_paths = lambda: [sources.Item(index) for index in range(1, sources_count)]
+            self.configuration_offline_setup_source_sources_paths = lambda: (sources.Item(index) for index in range(1, sources.Count + 1))
             self.configuration_online_setup = win32com.client.Dispatch(self.configuration_com_obj.OnlineSetup)
             self.configuration_online_setup_bus_statistics = win32com.client.Dispatch(self.configuration_online_setup.BusStatistics)
             self.configuration_online_setup_bus_statistics_bus_statistic = lambda bus_type, channel: win32com.client.Dispatch(self.configuration_online_setup_bus_statistics.BusStatistic(bus_type, channel))
             self.configuration_general_setup = CanoeConfigurationGeneralSetup(self.configuration_com_obj)
-            self.configuration_simulation_setup = lambda: CanoeConfigurationSimulationSetup(self.configuration_com_obj)
-            self.__replay_blocks = self.configuration_simulation_setup().replay_collection.fetch_replay_blocks()
-            self.configuration_test_setup = lambda: CanoeConfigurationTestSetup(self.configuration_com_obj)
-            self.__test_setup_environments = self.configuration_test_setup().test_environments.fetch_all_test_environments()
-            self.__test_modules = list()
-            for te_name, te_inst in self.__test_setup_environments.items():
-                for tm_name, tm_inst in te_inst.get_all_test_modules().items():
-                    self.__test_modules.append({'name': tm_name, 'object': tm_inst, 'environment': te_name})
+            self.configuration_simulation_setup = self.__configuration_simulation_setup
+            self.configuration_test_setup = self.__configuration_test_setup
         except Exception as e:
             self.__log.error(f'😡 Error initializing CANoe configuration: {str(e)}')
 
+    def __configuration_simulation_setup(self):
+        if self.__simulation_setup_cache is None:
+            self.__simulation_setup_cache = CanoeConfigurationSimulationSetup(self.configuration_com_obj)
+        return self.__simulation_setup_cache
+
+    def __configuration_test_setup(self):
+        if self.__test_setup_cache is None:
+            self.__test_setup_cache = CanoeConfigurationTestSetup(self.configuration_com_obj)
+        return self.__test_setup_cache
+
     def __init_canoe_application_environment(self):
         try:
             self.environment_obj_inst = CanoeEnvironment(self.application_com_obj)
@@ -120,7 +256,6 @@ class CANoe:
         try:
             self.networks_com_obj = win32com.client.Dispatch(self.application_com_obj.Networks)
             self.networks_obj = lambda: CanoeNetworks(self.networks_com_obj)
-            self.__diag_devices = self.networks_obj().fetch_all_diag_devices()
         except Exception as e:
             self.__log.error(f'😡 Error initializing CANoe networks: {str(e)}')
             sys.exit(1)
@@ -151,9 +286,123 @@ class CANoe:
             self.__log.error(f'😡 Error initializing CANoe version: {str(e)}')
             sys.exit(1)
 
+    def __reset_configuration_caches(self):
+        self.__diag_devices_cache = None
+        self.__simulation_setup_cache = None
+        self.__test_setup_cache = None
+        self.__replay_blocks_cache = None
+        self.__test_setup_environments_cache = None
+        self.__test_modules_cache = None
+        self.__test_modules_by_name_cache = None
+        self.__bus_objs = dict()
+        self.__get_bus_com_method = None
+        self.__bus_statistic_objs = dict()
+        self.__bus_statistic_dispids = dict()
+        self.__signal_objs = dict()
+        self.__j1939_signal_objs = dict()
+        self.__diag_request_pool = OrderedDict()
+        self.__diag_request_pool_measurement = CANoe.CANOE_MEASUREMENT_INIT_COUNT
+        self.__diag_response_dispids = dict()
+        self.__env_var_objs = dict()
+        self.__sys_var_objs = dict()
+        self.__sys_var_array_infos = dict()
+        self.__namespace_objs = dict()
+        self.__bus_databases_infos = dict()
+        self.__write_window_disabled_output_tabs = set()
+
+    def __get_bus(self, bus: str):
+        bus_obj = self.__bus_objs.get(bus)
+        if bus_obj is None:
+            get_bus = self.__get_bus_com_method or self.application_com_obj.GetBus
+            bus_obj = self.__bus_objs[bus] = get_bus(bus)
+        return bus_obj
+
+    def __get_can_bus_statistic(self, channel: int):
+        bus_statistic_obj = self.__bus_statistic_objs.get(channel)
+        if bus_statistic_obj is None:
+            bus_statistic_obj = self.__bus_statistic_objs[channel] = self.configuration_online_setup_bus_statistics_bus_statistic(CANoe.BUS_TYPES['CAN'], channel)
+        return bus_statistic_obj
+
+    def __get_signal(self, bus: str, channel: int, message: str, signal: str):
+        signal_key = (bus, channel, message, signal)
+        signal_obj = self.__signal_objs.get(signal_key)
+        if signal_obj is None:
+            signal_obj = self.__signal_objs[signal_key] = self.__get_bus(bus).GetSignal(channel, message, signal)
+        return signal_obj
+
+    def __get_j1939_signal(self, bus: str, channel: int, message: str, signal: str, source_addr: int, dest_addr: int):
+        signal_key = (bus, channel, message, signal, source_addr, dest_addr)
+        signal_obj = self.__j1939_signal_objs.get(signal_key)
+        if signal_obj is None:
+            signal_obj = self.__j1939_signal_objs[signal_key] = self.__get_bus(bus).GetJ1939Signal(channel, message, signal, source_addr, dest_addr)
+        return signal_obj
+
+    def __get_environment_variable(self, env_var_name: str):
+        env_var_objs = self.__env_var_objs
+        variable = env_var_objs.get(env_var_name)
+        if variable is None:
+            try:
+                variable = self.environment_obj_inst.get_variable(env_var_name)
+            except pythoncom.com_error:
+                return None
+            env_var_objs[env_var_name] = variable
+        return variable
+
+    def __get_system_variable(self, sys_var_name: str):
+        variable_com_object = self.__sys_var_objs.get(sys_var_name)
+        if variable_com_object is None:
+            namespace, _, variable_name = sys_var_name.rpartition('::')
+            namespace_com_object = self.__namespace_objs.get(namespace)
+            if namespace_com_object is None:
+                namespace_com_object = self.__namespace_objs[namespace] = win32com.client.Dispatch(self.system_com_obj.Namespaces(namespace))
+            variable_com_object = win32com.client.Dispatch(namespace_com_object.Variables(variable_name))
+            self.__sys_var_objs[sys_var_name] = variable_com_object
+        return variable_com_object
+
+    @property
+    def __diag_devices(self) -> LazyCOMMapping:
+        if self.__diag_devices_cache is None:
+            self.__diag_devices_cache = LazyCOMMapping(self.networks_obj().iter_diag_devices())
+        return self.__diag_devices_cache
+
+    @property
+    def __replay_blocks(self) -> LazyCOMMapping:
+        if self.__replay_blocks_cache is None:
+            self.__replay_blocks_cache = LazyCOMMapping(self.configuration_simulation_setup().replay_collection.iter_replay_blocks())
+        return self.__replay_blocks_cache
+
+    @property
+    def __test_setup_environments(self) -> dict:
+        if self.__test_setup_environments_cache is None:
+            self.__test_setup_environments_cache = self.configuration_test_setup().test_environments.fetch_all_test_environments()
+        return self.__test_setup_environments_cache
+
+    @property
+    def __test_modules(self) -> list:
+        if self.__test_modules_cache is None:
+            test_modules = list()
+            for te_name, te_inst in self.__test_setup_environments.items():
+                for tm_name, tm_inst in te_inst.get_all_test_modules().items():
+                    test_modules.append({'name': tm_name, 'object': tm_inst, 'environment': te_name})
+            self.__test_modules_cache = test_modules
+        return self.__test_modules_cache
+
+    @property
+    def __test_modules_by_name(self) -> dict:
+        if self.__test_modules_by_name_cache is None:
+            test_modules_by_name = dict()
+            for tm in self.__test_modules:
+                test_modules_by_name.setdefault(tm['name'], []).append(tm)
+            self.__test_modules_by_name_cache = test_modules_by_name
+        return self.__test_modules_by_name_cache
+
     def new(self, auto_save=False, prompt_user=False) -> None:
         try:
+            self.flush_write_window()
             self.__init_canoe_application()
+            self.__version_info = None
+            self.__reset_configuration_caches()
+            self.__opened_cfg_info = None
             self.application_com_obj.New(auto_save, prompt_user)
             self.__log.debug(f'📢 New CANoe configuration successfully created 🎉')
         except Exception as e:
@@ -169,23 +418,35 @@ class CANoe:
             auto_save (bool, optional): A boolean value that indicates whether the active configuration should be saved if it has been changed. Defaults to True.
             prompt_user (bool, optional): A boolean value that indicates whether the user should intervene in error situations. Defaults to False.
             auto_stop (bool, optional): A boolean value that indicates whether to stop the measurement before opening the configuration. Defaults to True.
+
+        Note:
+            if the same configuration is already loaded, saved and not modified on disk since it was opened, it is not loaded again.
         """
+        self.flush_write_window()
         self.__init_canoe_application()
         self.__init_canoe_application_measurement()
         self.__init_canoe_application_simulation()
         self.__init_canoe_application_version()
+        self.__version_info = None
+        self.__reset_configuration_caches()
         try:
             self.application_com_obj.Visible = visible
-            if self.measurement_com_obj.Running and not auto_stop:
+            measurement_running = self.measurement_com_obj.Running
+            if measurement_running and not auto_stop:
                 self.__log.error('😡 Measurement is running. Stop the measurement or set argument auto_stop=True')
                 sys.exit(1)
-            elif self.measurement_com_obj.Running and auto_stop:
+            elif measurement_running:
                 self.__log.warning('😇 Active Measurement is running. Stopping measurement before opening your configuration')
-                self.stop_ex_measurement()
+                self.__stop_measurement(running=measurement_running)
             if os.path.isfile(canoe_cfg):
-                self.__log.debug('⏳ wait for application to open')
-                self.application_com_obj.Open(canoe_cfg, auto_save, prompt_user)
-                self.wait_for_canoe_app_to_open()
+                canoe_cfg_info = (os.path.normcase(os.path.abspath(canoe_cfg)), os.path.getmtime(canoe_cfg))
+                if self.__configuration_already_opened(canoe_cfg_info):
+                    self.__log.debug('😇 configuration already opened. skipped reloading it')
+                else:
+                    self.__log.debug('⏳ wait for application to open')
+                    self.application_com_obj.Open(canoe_cfg, auto_save, prompt_user)
+                    self.wait_for_canoe_app_to_open()
+                    self.__opened_cfg_info = canoe_cfg_info
                 self.__init_canoe_application_bus()
                 self.__init_canoe_application_capl()
                 self.__init_canoe_application_configuration()
@@ -201,15 +462,27 @@ class CANoe:
             self.__log.error(f'😡 Error opening CANoe configuration: {str(e)}')
             sys.exit(1)
 
+    def __configuration_already_opened(self, canoe_cfg_info: tuple) -> bool:
+        if self.__opened_cfg_info != canoe_cfg_info:
+            return False
+        configuration_com_obj = self.application_com_obj.Configuration
+        loaded_cfg = configuration_com_obj.FullName
+        return bool(loaded_cfg) and os.path.normcase(os.path.abspath(loaded_cfg)) == canoe_cfg_info[0] and configuration_com_obj.Saved
+
     def quit(self):
         """Quits CANoe without saving changes in the configuration."""
         try:
+            self.flush_write_window()
             wait(0.5)
             self.__log.debug('⏳ wait for application to quit')
             self.application_com_obj.Quit()
             self.wait_for_canoe_app_to_close()
             wait(0.5)
-            pythoncom.CoUninitialize()
+            if self.__com_initialized:
+                pythoncom.CoUninitialize()
+                self.__com_initialized = False
+            self.__reset_configuration_caches()
+            self.__opened_cfg_info = None
             self.application_com_obj = None
             self.__log.debug('📢 CANoe Application Closed')
         except Exception as e:
@@ -228,15 +501,21 @@ class CANoe:
         try:
             meas_run_sts = {True: "Started 🏃‍♂️", False: "Not Started 🧍‍♂️"}
             self.measurement_start_stop_timeout = timeout
-            if self.measurement_com_obj.Running:
-                self.__log.warning(f'⚠️ CANoe Measurement already running 🏃‍♂️')
+            measurement_com_obj = self.measurement_com_obj
+            running = measurement_com_obj.Running
+            if running:
+                self.__log.warning('⚠️ CANoe Measurement already running 🏃‍♂️')
             else:
-                self.measurement_com_obj.Start()
-                if not self.measurement_com_obj.Running:
-                    self.__log.debug(f'⏳ waiting for measurement to start')
+                CANoe.CANOE_MEASUREMENT_STARTED = False
+                self.__diag_request_pool.clear()
+                measurement_com_obj.Start()
+                running = measurement_com_obj.Running
+                if not running:
+                    self.__log.debug('⏳ waiting for measurement to start')
                     self.wait_for_canoe_meas_to_start()
-                    self.__log.debug(f'👉 CANoe Measurement {meas_run_sts[self.measurement_com_obj.Running]}')
-            return self.measurement_com_obj.Running
+                    running = measurement_com_obj.Running
+                    self.__log.debug('👉 CANoe Measurement %s', meas_run_sts[running])
+            return running
         except Exception as e:
             self.__log.error(f'😡 Error starting measurement: {str(e)}')
             sys.exit(1)
@@ -261,33 +540,51 @@ class CANoe:
         Returns:
             True if measurement stopped. else False.
         """
+        return self.__stop_measurement(timeout)
+
+    def __stop_measurement(self, timeout=60, running=None) -> bool:
+        # running can be passed by callers that already read Measurement.Running.
         try:
+            self.flush_write_window()
             meas_run_sts = {True: "Not Stopped 🏃‍♂️ ", False: "Stopped 🧍‍♂️"}
             self.measurement_start_stop_timeout = timeout
-            if self.measurement_com_obj.Running:
-                self.measurement_com_obj.Stop()
-                if self.measurement_com_obj.Running:
-                    self.__log.debug(f'⏳ waiting for measurement to stop 🧍‍♂️')
+            measurement_com_obj = self.measurement_com_obj
+            if running is None:
+                running = measurement_com_obj.Running
+            if running:
+                CANoe.CANOE_MEASUREMENT_STOPPED = False
+                measurement_com_obj.Stop()
+                self.__diag_request_pool.clear()
+                running = measurement_com_obj.Running
+                if running:
+                    self.__log.debug('⏳ waiting for measurement to stop 🧍‍♂️')
                     self.wait_for_canoe_meas_to_stop()
-                    self.__log.debug(f'👉 CANoe Measurement {meas_run_sts[self.measurement_com_obj.Running]}')
+                    running = measurement_com_obj.Running
+                    self.__log.debug('👉 CANoe Measurement %s', meas_run_sts[running])
             else:
-                self.__log.warning(f'⚠️ CANoe Measurement already stopped 🧍‍♂️')
-            return not self.measurement_com_obj.Running
+                self.__log.warning('⚠️ CANoe Measurement already stopped 🧍‍♂️')
+            return not running
         except Exception as e:
             self.__log.error(f'😡 Error stopping measurement: {str(e)}')
             sys.exit(1)
 
-    def reset_measurement(self) -> bool:
+    def reset_measurement(self, timeout=60) -> bool:
         """reset(stop and start) the measurement.
+        measurement is started again only after the stop event is received.
+
+        Args:
+            timeout (int, optional): measurement start/stop event timeout in seconds. Defaults to 60.
 
         Returns:
             Measurement running status(True/False).
         """
         try:
-            self.stop_measurement()
-            self.start_measurement()
-            self.__log.debug(f'👉 active measurement resetted 🔁')
-            return self.measurement_com_obj.Running
+            if not self.stop_measurement(timeout):
+                self.__log.warning('⚠️ measurement not stopped. skipped measurement restart')
+                return self.measurement_com_obj.Running
+            running = self.start_measurement(timeout)
+            self.__log.debug('👉 active measurement resetted 🔁')
+            return running
         except Exception as e:
             self.__log.error(f'😡 Error resetting measurement: {str(e)}')
             sys.exit(1)
@@ -301,6 +598,40 @@ class CANoe:
         """
         return self.measurement_com_obj.Running
 
+    def wait_for_measurement_started(self, timeout=60) -> bool:
+        """Waits until the measurement start event is received instead of sleeping for a fixed time.
+
+        Args:
+            timeout (int, optional): maximum time to wait in seconds. Defaults to 60.
+
+        Returns:
+            True if measurement is running. else False.
+        """
+        measurement_com_obj = self.measurement_com_obj
+        # running state is checked as well. start event doesn't come when measurement is already running.
+        if self.measurement_events_enabled:
+            DoMeasurementEventsUntil(lambda: CANoe.CANOE_MEASUREMENT_STARTED or measurement_com_obj.Running, lambda: timeout)
+        else:
+            DoMeasurementEventsUntil(lambda: measurement_com_obj.Running, lambda: timeout)
+        return measurement_com_obj.Running
+
+    def wait_for_measurement_stopped(self, timeout=60) -> bool:
+        """Waits until the measurement stop event is received instead of sleeping for a fixed time.
+
+        Args:
+            timeout (int, optional): maximum time to wait in seconds. Defaults to 60.
+
+        Returns:
+            True if measurement is stopped. else False.
+        """
+        measurement_com_obj = self.measurement_com_obj
+        # running state is checked as well. stop event doesn't come when measurement is already stopped.
+        if self.measurement_events_enabled:
+            DoMeasurementEventsUntil(lambda: CANoe.CANOE_MEASUREMENT_STOPPED or not measurement_com_obj.Running, lambda: timeout)
+        else:
+            DoMeasurementEventsUntil(lambda: not measurement_com_obj.Running, lambda: timeout)
+        return not measurement_com_obj.Running
+
     def add_offline_source_log_file(self, absolute_log_file_path: str) -> bool:
         """this method adds offline source log file.
 
@@ -313,7 +644,8 @@ class CANoe:
         try:
             if os.path.isfile(absolute_log_file_path):
                 offline_sources_paths = self.configuration_offline_setup_source_sources_paths()
-                file_already_added = any([file == absolute_log_file_path for file in offline_sources_paths])
+                target_path = os.path.normcase(os.path.normpath(absolute_log_file_path))
+                file_already_added = any(os.path.normcase(os.path.normpath(file)) == target_path for file in offline_sources_paths)
                 if file_already_added:
                     self.__log.warning(f'⚠️ File "{absolute_log_file_path}" already added as offline source')
                 else:
@@ -336,9 +668,9 @@ class CANoe:
         try:
             self.measurement_com_obj.AnimationDelay = animation_delay
             self.measurement_com_obj.Animate()
-            self.__log.debug(f'⏳ waiting for measurement to start 🏃‍♂️')
+            self.__log.debug('⏳ waiting for measurement to start 🏃‍♂️')
             self.wait_for_canoe_meas_to_start()
-            self.__log.debug(f"👉 started 🏃‍♂️ measurement in Animation mode with animation delay ⏲️ {animation_delay}")
+            self.__log.debug('👉 started 🏃‍♂️ measurement in Animation mode with animation delay ⏲️ %s', animation_delay)
         except Exception as e:
             self.__log.error(f'😡 Error starting measurement in animation mode: {str(e)}')
 
@@ -377,7 +709,7 @@ class CANoe:
         """
         try:
             meas_index = self.measurement_com_obj.MeasurementIndex
-            self.__log.debug(f'👉 measurement_index value 🟰 {meas_index}')
+            self.__log.debug('👉 measurement_index value 🟰 %s', meas_index)
             return meas_index
         except Exception as e:
             self.__log.error(f'😡 Error getting measurement index: {str(e)}')
@@ -394,7 +726,7 @@ class CANoe:
         """
         try:
             self.measurement_com_obj.MeasurementIndex = index
-            self.__log.debug(f'👉 measurement_index value set to ➡️ {index}')
+            self.__log.debug('👉 measurement_index value set to ➡️ %s', index)
             return index
         except Exception as e:
             self.__log.error(f'😡 Error setting measurement index: {str(e)}')
@@ -407,12 +739,15 @@ class CANoe:
             True if configuration saved. else False.
         """
         try:
-            if not self.configuration_com_obj.Saved:
-                self.configuration_com_obj.Save()
-                self.__log.debug('💾 configuration saved successfully')
-            else:
+            configuration_com_obj = self.configuration_com_obj
+            if configuration_com_obj.Saved:
                 self.__log.debug('😇 configuration already saved')
-            return self.configuration_com_obj.Saved
+                return True
+            configuration_com_obj.Save()
+            saved = configuration_com_obj.Saved
+            if saved:
+                self.__log.debug('💾 configuration saved successfully')
+            return saved
         except Exception as e:
             self.__log.error(f'😡 Error saving configuration: {str(e)}')
             return False
@@ -430,10 +765,12 @@ class CANoe:
             True if configuration saved. else False.
         """
         try:
-            config_path = '\\'.join(path.split('\\')[:-1])
-            if not os.path.exists(config_path) and create_dir:
+            config_path = os.path.dirname(path)
+            config_path_exists = os.path.isdir(config_path)
+            if not config_path_exists and create_dir:
                 os.makedirs(config_path, exist_ok=True)
-            if os.path.exists(config_path):
+                config_path_exists = True
+            if config_path_exists:
                 self.configuration_com_obj.SaveAs(path, major, minor, prompt_user)
                 if self.configuration_com_obj.Saved:
                     self.__log.debug(f'💾 configuration saved as {path} successfully')
@@ -455,35 +792,45 @@ class CANoe:
             channel (int): The channel of the statistic that is to be returned.
 
         Returns:
-            CAN bus statistics.
+            CAN bus statistics. empty dict on failure.
+        """
+        statistics_info = self.get_can_bus_statistics_info(channel)
+        return {} if statistics_info is None else statistics_info._asdict()
+
+    def get_can_bus_statistics_info(self, channel: int) -> Union[CanoeCanBusStatistics, None]:
+        """Returns CAN Bus Statistics as named tuple. fields are read as attributes (ex- stats.bus_load).
+
+        Args:
+            channel (int): The channel of the statistic that is to be returned.
+
+        Returns:
+            CAN bus statistics as CanoeCanBusStatistics named tuple. None on failure.
         """
         try:
-            bus_types = {'CAN': 1, 'J1939': 2, 'TTP': 4, 'LIN': 5, 'MOST': 6, 'Kline': 14}
-            can_bus_statistic_obj = self.configuration_online_setup_bus_statistics_bus_statistic(bus_types['CAN'], channel)
-            statistics_info = {
-                'bus_load': can_bus_statistic_obj.BusLoad,
-                'chip_state': can_bus_statistic_obj.ChipState,
-                'error': can_bus_statistic_obj.Error,
-                'error_total': can_bus_statistic_obj.ErrorTotal,
-                'extended': can_bus_statistic_obj.Extended,
-                'extended_total': can_bus_statistic_obj.ExtendedTotal,
-                'extended_remote': can_bus_statistic_obj.ExtendedRemote,
-                'extended_remote_total': can_bus_statistic_obj.ExtendedRemoteTotal,
-                'overload': can_bus_statistic_obj.Overload,
-                'overload_total': can_bus_statistic_obj.OverloadTotal,
-                'peak_load': can_bus_statistic_obj.PeakLoad,
-                'rx_error_count': can_bus_statistic_obj.RxErrorCount,
-                'standard': can_bus_statistic_obj.Standard,
-                'standard_total': can_bus_statistic_obj.StandardTotal,
-                'standard_remote': can_bus_statistic_obj.StandardRemote,
-                'standard_remote_total': can_bus_statistic_obj.StandardRemoteTotal,
-                'tx_error_count': can_bus_statistic_obj.TxErrorCount,
-            }
-            self.__log.debug(f'👉 CAN Bus Statistics ℹ️nfo 🟰 {statistics_info}')
+            can_bus_statistic_obj = self.__get_can_bus_statistic(channel)
+            statistics_info = CanoeCanBusStatistics(*GetComPropertyValues(can_bus_statistic_obj, CanoeCanBusStatistics.COM_PROPERTY_NAMES, self.__bus_statistic_dispids))
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 CAN Bus Statistics ℹ️nfo 🟰 %s', statistics_info._asdict())
             return statistics_info
         except Exception as e:
-            self.__log.error(f'😡 Error getting CAN Bus Statistics: {str(e)}')
-            return {}
+            self.__log.error(f'😡 Error getting CAN Bus Statistics of channel {channel}: {str(e)}')
+            return None
+
+    def get_can_bus_statistics_bulk(self, channels: tuple) -> dict:
+        """Returns CAN Bus Statistics of several channels in one call.
+
+        Args:
+            channels (tuple): The channels of the statistics that are to be returned. Ex- (1, 2)
+
+        Returns:
+            channel as key and CanoeCanBusStatistics named tuple as value. channels that failed are left out.
+        """
+        statistics_infos = dict()
+        for channel in channels:
+            statistics_info = self.get_can_bus_statistics_info(channel)
+            if statistics_info is not None:
+                statistics_infos[channel] = statistics_info
+        return statistics_infos
 
     def get_canoe_version_info(self) -> dict:
         """The Version class represents the version of the CANoe application.
@@ -497,16 +844,19 @@ class CANoe:
             "patch" - The patch number of the CANoe application.
         """
         try:
-            version_info = {'full_name': self.version_com_obj.FullName,
-                            'name': self.version_com_obj.Name,
-                            'build': self.version_com_obj.Build,
-                            'major': self.version_com_obj.major,
-                            'minor': self.version_com_obj.minor,
-                            'patch': self.version_com_obj.Patch}
-            self.__log.debug('> CANoe Application.Version ℹ️nfo<'.center(50, '➖'))
-            for k, v in version_info.items():
-                self.__log.debug(f'{k:<10}: {v}')
-            self.__log.debug(''.center(50, '➖'))
+            if self.__version_info is None:
+                self.__version_info = {'full_name': self.version_com_obj.FullName,
+                                       'name': self.version_com_obj.Name,
+                                       'build': self.version_com_obj.Build,
+                                       'major': self.version_com_obj.Major,
+                                       'minor': self.version_com_obj.Minor,
+                                       'patch': self.version_com_obj.Patch}
+            version_info = dict(self.__version_info)
+            if self.__log_debug_enabled:
+                self.__log.debug(CANoe.VERSION_INFO_LOG_TITLE)
+                for k, v in version_info.items():
+                    self.__log.debug('%-10s: %s', k, v)
+                self.__log.debug(CANoe.LOG_SEPARATOR)
             return version_info
         except Exception as e:
             self.__log.error(f'😡 Error getting CANoe version info: {str(e)}')
@@ -522,17 +872,21 @@ class CANoe:
             bus database info {'path': 'value', 'channel': 'value', 'full_name': 'value'}
         """
         try:
-            dbcs_info = dict()
-            app_bus_databases_obj = win32com.client.Dispatch(self.application_com_obj.GetBus(bus).Databases)
-            for item in app_bus_databases_obj:
-                database_obj = win32com.client.Dispatch(item)
-                dbcs_info[database_obj.Name] = {
-                    'path': database_obj.Path,
-                    'channel': database_obj.Channel,
-                    'full_name': database_obj.FullName
-                    }
-            self.__log.debug(f'👉 {bus} bus databases ℹ️nfo 🟰 {dbcs_info}')
-            return dbcs_info
+            dbcs_info = self.__bus_databases_infos.get(bus)
+            if dbcs_info is None:
+                dbcs_info = dict()
+                dispids = dict()
+                app_bus_databases_obj = win32com.client.Dispatch(self.__get_bus(bus).Databases)
+                for item in app_bus_databases_obj:
+                    name, path, channel, full_name = GetComPropertyValues(item, ('Name', 'Path', 'Channel', 'FullName'), dispids)
+                    dbcs_info[name] = {
+                        'path': path,
+                        'channel': channel,
+                        'full_name': full_name
+                        }
+                self.__bus_databases_infos[bus] = dbcs_info
+            self.__log.debug('👉 %s bus databases ℹ️nfo 🟰 %s', bus, dbcs_info)
+            return {name: dict(info) for name, info in dbcs_info.items()}
         except Exception as e:
             self.__log.error(f'😡 Error getting {bus} bus databases info: {str(e)}')
             return {}
@@ -548,15 +902,16 @@ class CANoe:
         """
         try:
             nodes_info = dict()
-            app_bus_nodes_obj = win32com.client.Dispatch(self.application_com_obj.GetBus(bus).Nodes)
+            dispids = dict()
+            app_bus_nodes_obj = win32com.client.Dispatch(self.__get_bus(bus).Nodes)
             for item in app_bus_nodes_obj:
-                node_obj = win32com.client.Dispatch(item)
-                nodes_info[node_obj.Name] = {
-                    'path': node_obj.Path,
-                    'full_name': node_obj.FullName,
-                    'active': node_obj.Active
+                name, path, full_name, active = GetComPropertyValues(item, ('Name', 'Path', 'FullName', 'Active'), dispids)
+                nodes_info[name] = {
+                    'path': path,
+                    'full_name': full_name,
+                    'active': active
                     }
-            self.__log.debug(f'👉 {bus} bus nodes ℹ️nfo 🟰 {nodes_info}')
+            self.__log.debug('👉 %s bus nodes ℹ️nfo 🟰 %s', bus, nodes_info)
             return nodes_info
         except Exception as e:
             self.__log.error(f'😡 Error getting {bus} bus nodes info: {str(e)}')
@@ -576,9 +931,10 @@ class CANoe:
             signal value.
         """
         try:
-            signal_obj = self.application_com_obj.GetBus(bus).GetSignal(channel, message, signal)
+            signal_obj = self.__get_signal(bus, channel, message, signal)
             signal_value = signal_obj.RawValue if raw_value else signal_obj.Value
-            self.__log.debug(f'👉 value of signal({bus}{channel}.{message}.{signal}) 🟰 {signal_value}')
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 value of signal(%s%s.%s.%s) 🟰 %s', bus, channel, message, signal, signal_value)
             return signal_value
         except Exception as e:
             self.__log.error(f'😡 Error getting signal value: {str(e)}')
@@ -596,15 +952,59 @@ class CANoe:
             raw_value (bool): return raw value of the signal if true. Default(False) is physical value.
         """
         try:
-            signal_obj = self.application_com_obj.GetBus(bus).GetSignal(channel, message, signal)
+            signal_obj = self.__get_signal(bus, channel, message, signal)
             if raw_value:
                 signal_obj.RawValue = value
             else:
                 signal_obj.Value = value
-            self.__log.debug(f'👉 signal({bus}{channel}.{message}.{signal}) value set to {value}')
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 signal(%s%s.%s.%s) value set to %s', bus, channel, message, signal, value)
         except Exception as e:
             self.__log.error(f'😡 Error setting signal value: {str(e)}')
 
+    def get_signal_values(self, signals: list, raw_value=False) -> list:
+        """get_signal_values Returns values of multiple signals in one call.
+        Bus objects are cached per bus instead of being fetched once per signal.
+
+        Args:
+            signals (list): list of (bus, channel, message, signal) tuples.
+            raw_value (bool): return raw values of the signals if true. Default(False) is physical value.
+
+        Returns:
+            list of signal values in the same order as signals. None for signals that could not be read.
+        """
+        signal_values = []
+        for bus, channel, message, signal in signals:
+            try:
+                signal_obj = self.__get_signal(bus, channel, message, signal)
+                signal_values.append(signal_obj.RawValue if raw_value else signal_obj.Value)
+            except Exception as e:
+                self.__log.error(f'😡 Error getting signal({bus}{channel}.{message}.{signal}) value: {str(e)}')
+                signal_values.append(None)
+        if self.__log_debug_enabled:
+            self.__log.debug('👉 values of %s signals 🟰 %s', len(signal_values), signal_values)
+        return signal_values
+
+    def set_signal_values(self, signals: list, raw_value=False) -> None:
+        """set_signal_values sets values to multiple signals in one call. Works only when messages are sent using CANoe IL.
+        Bus objects are cached per bus instead of being fetched once per signal.
+
+        Args:
+            signals (list): list of (bus, channel, message, signal, value) tuples.
+            raw_value (bool): set raw values of the signals if true. Default(False) is physical value.
+        """
+        for bus, channel, message, signal, value in signals:
+            try:
+                signal_obj = self.__get_signal(bus, channel, message, signal)
+                if raw_value:
+                    signal_obj.RawValue = value
+                else:
+                    signal_obj.Value = value
+            except Exception as e:
+                self.__log.error(f'😡 Error setting signal({bus}{channel}.{message}.{signal}) value: {str(e)}')
+        if self.__log_debug_enabled:
+            self.__log.debug('👉 values set for %s signals', len(signals))
+
     def get_signal_full_name(self, bus: str, channel: int, message: str, signal: str) -> str:
         """Determines the fully qualified name of a signal.
 
@@ -618,9 +1018,10 @@ class CANoe:
             str: The fully qualified name of a signal. The following format will be used for signals: <DatabaseName>::<MessageName>::<SignalName>
         """
         try:
-            signal_obj = self.application_com_obj.GetBus(bus).GetSignal(channel, message, signal)
+            signal_obj = self.__get_signal(bus, channel, message, signal)
             signal_fullname = signal_obj.FullName
-            self.__log.debug(f'👉 signal({bus}{channel}.{message}.{signal}) full name 🟰 {signal_fullname}')
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 signal(%s%s.%s.%s) full name 🟰 %s', bus, channel, message, signal, signal_fullname)
             return signal_fullname
         except Exception as e:
             self.__log.error(f'😡 Error getting signal full name: {str(e)}')
@@ -639,9 +1040,10 @@ class CANoe:
             TRUE if the measurement is running and the signal has been received. FALSE if not.
         """
         try:
-            signal_obj = self.application_com_obj.GetBus(bus).GetSignal(channel, message, signal)
+            signal_obj = self.__get_signal(bus, channel, message, signal)
             sig_online_status = signal_obj.IsOnline
-            self.__log.debug(f'👉 signal({bus}{channel}.{message}.{signal}) online status 🟰 {sig_online_status}')
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 signal(%s%s.%s.%s) online status 🟰 %s', bus, channel, message, signal, sig_online_status)
             return sig_online_status
         except Exception as e:
             self.__log.error(f'😡 Error checking signal online status: {str(e)}')
@@ -664,9 +1066,10 @@ class CANoe:
                 3- The signal has been received in the current measurement; the current value is returned.
         """
         try:
-            signal_obj = self.application_com_obj.GetBus(bus).GetSignal(channel, message, signal)
+            signal_obj = self.__get_signal(bus, channel, message, signal)
             sig_state = signal_obj.State
-            self.__log.debug(f'👉 signal({bus}{channel}.{message}.{signal}) state 🟰 {sig_state}')
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 signal(%s%s.%s.%s) state 🟰 %s', bus, channel, message, signal, sig_state)
             return sig_state
         except Exception as e:
             self.__log.error(f'😡 Error checking signal state: {str(e)}')
@@ -687,9 +1090,10 @@ class CANoe:
             signal value.
         """
         try:
-            signal_obj = self.application_com_obj.GetBus(bus).GetJ1939Signal(channel, message, signal, source_addr, dest_addr)
+            signal_obj = self.__get_j1939_signal(bus, channel, message, signal, source_addr, dest_addr)
             signal_value = signal_obj.RawValue if raw_value else signal_obj.Value
-            self.__log.debug(f'👉 value of signal({bus}{channel}.{message}.{signal}) 🟰 {signal_value}')
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 value of signal(%s%s.%s.%s) 🟰 %s', bus, channel, message, signal, signal_value)
             return signal_value
         except Exception as e:
             self.__log.error(f'😡 Error getting signal value: {str(e)}')
@@ -711,12 +1115,13 @@ class CANoe:
             signal value.
         """
         try:
-            signal_obj = self.application_com_obj.GetBus(bus).GetJ1939Signal(channel, message, signal, source_addr, dest_addr)
+            signal_obj = self.__get_j1939_signal(bus, channel, message, signal, source_addr, dest_addr)
             if raw_value:
                 signal_obj.RawValue = value
             else:
                 signal_obj.Value = value
-            self.__log.debug(f'👉 signal({bus}{channel}.{message}.{signal}) value set to {value}')
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 signal(%s%s.%s.%s) value set to %s', bus, channel, message, signal, value)
         except Exception as e:
             self.__log.error(f'😡 Error setting signal value: {str(e)}')
 
@@ -735,9 +1140,10 @@ class CANoe:
             str: The fully qualified name of a signal. The following format will be used for signals: <DatabaseName>::<MessageName>::<SignalName>
         """
         try:
-            signal_obj = self.application_com_obj.GetBus(bus).GetJ1939Signal(channel, message, signal, source_addr, dest_addr)
+            signal_obj = self.__get_j1939_signal(bus, channel, message, signal, source_addr, dest_addr)
             signal_fullname = signal_obj.FullName
-            self.__log.debug(f'👉 signal({bus}{channel}.{message}.{signal}) full name 🟰 {signal_fullname}')
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 signal(%s%s.%s.%s) full name 🟰 %s', bus, channel, message, signal, signal_fullname)
             return signal_fullname
         except Exception as e:
             self.__log.error(f'😡 Error getting signal full name: {str(e)}')
@@ -758,9 +1164,10 @@ class CANoe:
             bool: TRUE: if the measurement is running and the signal has been received. FALSE: if not.
         """
         try:
-            signal_obj = self.application_com_obj.GetBus(bus).GetJ1939Signal(channel, message, signal, source_addr, dest_addr)
+            signal_obj = self.__get_j1939_signal(bus, channel, message, signal, source_addr, dest_addr)
             sig_online_status = signal_obj.IsOnline
-            self.__log.debug(f'👉 signal({bus}{channel}.{message}.{signal}) online status 🟰 {sig_online_status}')
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 signal(%s%s.%s.%s) online status 🟰 %s', bus, channel, message, signal, sig_online_status)
             return sig_online_status
         except Exception as e:
             self.__log.error(f'😡 Error checking signal online status: {str(e)}')
@@ -777,9 +1184,10 @@ class CANoe:
                     3: The signal has been received in the current measurement; the current value is returned.
         """
         try:
-            signal_obj = self.application_com_obj.GetBus(bus).GetJ1939Signal(channel, message, signal, source_addr, dest_addr)
+            signal_obj = self.__get_j1939_signal(bus, channel, message, signal, source_addr, dest_addr)
             sig_state = signal_obj.State
-            self.__log.debug(f'👉 signal({bus}{channel}.{message}.{signal}) state 🟰 {sig_state}')
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 signal(%s%s.%s.%s) state 🟰 %s', bus, channel, message, signal, sig_state)
             return sig_state
         except Exception as e:
             self.__log.error(f'😡 Error checking signal state: {str(e)}')
@@ -792,7 +1200,7 @@ class CANoe:
         """
         try:
             self.ui_com_obj.ActivateDesktop(name)
-            self.__log.debug(f'👉 Activated the desktop({name})')
+            self.__log.debug('👉 Activated the desktop(%s)', name)
         except Exception as e:
             self.__log.error(f'😡 Error activating the desktop: {str(e)}')
 
@@ -804,17 +1212,37 @@ class CANoe:
         except Exception as e:
             self.__log.error(f'😡 Error opening baudrate dialog: {str(e)}')
 
-    def write_text_in_write_window(self, text: str) -> None:
+    def write_text_in_write_window(self, text: str, buffered=False) -> None:
         """Outputs a line of text in the Write Window.
         Args:
             text (str): The text.
+            buffered (bool): True to collect the line and write WRITE_WINDOW_BUFFER_SIZE lines with one Output call. Defaults to False.
+                buffered lines are also written by flush_write_window, read/clear of the Write Window, measurement stop and quit.
         """
         try:
+            if buffered:
+                self.__write_window_buffer.append(text)
+                if len(self.__write_window_buffer) >= CANoe.WRITE_WINDOW_BUFFER_SIZE:
+                    self.flush_write_window()
+                return
+            self.flush_write_window()
             self.ui_write_window_com_obj.Output(text)
-            self.__log.debug(f'✍️ text "{text}" written in the Write Window')
+            self.__log.debug('✍️ text "%s" written in the Write Window', text)
         except Exception as e:
             self.__log.error(f'😡 Error writing text in the Write Window: {str(e)}')
 
+    def flush_write_window(self) -> None:
+        """Writes the lines buffered by write_text_in_write_window(buffered=True) to the Write Window."""
+        if not self.__write_window_buffer:
+            return
+        try:
+            text = '\n'.join(self.__write_window_buffer)
+            self.__write_window_buffer.clear()
+            self.ui_write_window_com_obj.Output(text)
+            self.__log.debug('✍️ buffered text "%s" written in the Write Window', text)
+        except Exception as e:
+            self.__log.error(f'😡 Error writing buffered text in the Write Window: {str(e)}')
+
     def read_text_from_write_window(self) -> str:
         """read the text contents from Write Window.
 
@@ -822,8 +1250,9 @@ class CANoe:
             The text content.
         """
         try:
+            self.flush_write_window()
             text_content = self.ui_write_window_com_obj.Text
-            self.__log.debug(f'📖 text read from Write Window: {text_content}')
+            self.__log.debug('📖 text read from Write Window: %s', text_content)
             return text_content
         except Exception as e:
             self.__log.error(f'😡 Error reading text from Write Window: {str(e)}')
@@ -832,6 +1261,7 @@ class CANoe:
     def clear_write_window_content(self) -> None:
         """Clears the contents of the Write Window."""
         try:
+            self.flush_write_window()
             self.ui_write_window_com_obj.Clear()
             self.__log.debug('🧹 Write Window content cleared')
         except Exception as e:
@@ -853,12 +1283,13 @@ class CANoe:
             tab_index (int, optional): The index of the page, for which logging of the output is to be activated. Defaults to None.
         """
         try:
+            self.__write_window_disabled_output_tabs.clear()
             if tab_index:
                 self.ui_write_window_com_obj.EnableOutputFile(output_file, tab_index)
-                self.__log.debug(f'✔️ Enabled logging of outputs of the Write Window. output_file🟰{output_file} and tab_index🟰{tab_index}')
+                self.__log.debug('✔️ Enabled logging of outputs of the Write Window. output_file🟰%s and tab_index🟰%s', output_file, tab_index)
             else:
                 self.ui_write_window_com_obj.EnableOutputFile(output_file)
-                self.__log.debug(f'✔️ Enabled logging of outputs of the Write Window. output_file🟰{output_file}')
+                self.__log.debug('✔️ Enabled logging of outputs of the Write Window. output_file🟰%s', output_file)
         except Exception as e:
             self.__log.error(f'😡 Error enabling Write Window output file: {str(e)}')
 
@@ -869,12 +1300,16 @@ class CANoe:
             tab_index (int, optional): The index of the page, for which logging of the output is to be activated. Defaults to None.
         """
         try:
+            if tab_index in self.__write_window_disabled_output_tabs:
+                self.__log.debug('😇 Write Window output file already disabled. tab_index🟰%s', tab_index)
+                return
             if tab_index:
                 self.ui_write_window_com_obj.DisableOutputFile(tab_index)
-                self.__log.debug(f'⏹️ Disabled logging of outputs of the Write Window. tab_index🟰{tab_index}')
+                self.__log.debug('⏹️ Disabled logging of outputs of the Write Window. tab_index🟰%s', tab_index)
             else:
                 self.ui_write_window_com_obj.DisableOutputFile()
-                self.__log.debug(f'⏹️ Disabled logging of outputs of the Write Window')
+                self.__log.debug('⏹️ Disabled logging of outputs of the Write Window')
+            self.__write_window_disabled_output_tabs.add(tab_index)
         except Exception as e:
             self.__log.error(f'😡 Error disabling Write Window output file: {str(e)}')
 
@@ -889,11 +1324,26 @@ class CANoe:
         """
         new_var_com_obj = None
         try:
-            namespace_name = '::'.join(sys_var_name.split('::')[:-1])
-            variable_name = sys_var_name.split('::')[-1]
-            system_obj = self.system_obj()
-            system_obj.add_system_variable(namespace_name, variable_name, value)
-            self.__log.debug(f'👉 system variable({sys_var_name}) created and value set to {value}')
+            namespace_name, _, variable_name = sys_var_name.rpartition('::')
+            namespace_com_obj = self.__namespace_objs.get(namespace_name)
+            if namespace_com_obj is None:
+                system_obj = self.system_obj()
+                new_var_com_obj = system_obj.add_system_variable(namespace_name, variable_name, value)
+                if namespace_name in system_obj.namespaces_dict:
+                    self.__namespace_objs[namespace_name] = system_obj.namespaces_dict[namespace_name]
+            else:
+                try:
+                    self.__get_system_variable(sys_var_name)
+                    variable_exists = True
+                except pythoncom.com_error:
+                    variable_exists = False
+                if variable_exists:
+                    self.__log.warning(f'⚠️ The given variable ({variable_name}) already exists in the namespace ({namespace_name})')
+                    return None
+                new_var_com_obj = namespace_com_obj.Variables.Add(variable_name, value)
+            self.__sys_var_objs.pop(sys_var_name, None)
+            self.__sys_var_array_infos.pop(sys_var_name, None)
+            self.__log.debug('👉 system variable(%s) created and value set to %s', sys_var_name, value)
         except Exception as e:
             self.__log.error(f'😡 failed to create system variable({sys_var_name}). {e}')
         return new_var_com_obj
@@ -910,19 +1360,17 @@ class CANoe:
         """
         return_value = None
         try:
-            namespace = '::'.join(sys_var_name.split('::')[:-1])
-            variable_name = sys_var_name.split('::')[-1]
-            namespace_com_object = self.system_com_obj.Namespaces(namespace)
-            variable_com_object = win32com.client.Dispatch(namespace_com_object.Variables(variable_name))
+            variable_com_object = self.__get_system_variable(sys_var_name)
             var_value = variable_com_object.Value
             if return_symbolic_name and (variable_com_object.Type == 0):
                 var_value_name = variable_com_object.GetSymbolicValueName(var_value)
                 return_value = var_value_name
             else:
                 return_value = var_value
-            self.__log.debug(f'👉 system variable({sys_var_name}) value 🟰 {return_value}')
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 system variable(%s) value 🟰 %s', sys_var_name, return_value)
         except Exception as e:
-            self.__log.debug(f'😡 failed to get system variable({sys_var_name}) value. {e}')
+            self.__log.error(f'😡 failed to get system variable({sys_var_name}) value. {e}')
         return return_value
 
     def set_system_variable_value(self, sys_var_name: str, value: Union[int, float, str]) -> None:
@@ -933,19 +1381,17 @@ class CANoe:
             value (Union[int, float, str]): variable value. supported CAPL system variable data types integer, double, string and data.
         """
         try:
-            namespace = '::'.join(sys_var_name.split('::')[:-1])
-            variable_name = sys_var_name.split('::')[-1]
-            namespace_com_object = self.system_com_obj.Namespaces(namespace)
-            variable_com_object = namespace_com_object.Variables(variable_name)
+            variable_com_object = self.__get_system_variable(sys_var_name)
             if isinstance(variable_com_object.Value, int):
                 variable_com_object.Value = int(value)
             elif isinstance(variable_com_object.Value, float):
                 variable_com_object.Value = float(value)
             else:
                 variable_com_object.Value = value
-            self.__log.debug(f'👉 system variable({sys_var_name}) value set to {value}')
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 system variable(%s) value set to %s', sys_var_name, value)
         except Exception as e:
-            self.__log.debug(f'😡 failed to set system variable({sys_var_name}) value. {e}')
+            self.__log.error(f'😡 failed to set system variable({sys_var_name}) value. {e}')
 
     def set_system_variable_array_values(self, sys_var_name: str, value: tuple, index=0) -> None:
         """set_system_variable_array_values sets array of values to system variable.
@@ -956,26 +1402,34 @@ class CANoe:
             index (int): value of index where values will start updating. Defaults to 0.
         """
         try:
-            namespace = '::'.join(sys_var_name.split('::')[:-1])
-            variable_name = sys_var_name.split('::')[-1]
-            namespace_com_object = self.system_com_obj.Namespaces(namespace)
-            variable_com_object = namespace_com_object.Variables(variable_name)
-            existing_variable_value = list(variable_com_object.Value)
-            if (index + len(value)) <= len(existing_variable_value):
-                final_value = existing_variable_value
-                if isinstance(existing_variable_value[0], float):
-                    final_value[index: index + len(value)] = (float(v) for v in value)
+            variable_com_object = self.__get_system_variable(sys_var_name)
+            existing_variable_value = None
+            array_info = self.__sys_var_array_infos.get(sys_var_name)
+            if array_info is None:
+                existing_variable_value = variable_com_object.Value
+                array_info = (isinstance(existing_variable_value[0], float), len(existing_variable_value))
+                self.__sys_var_array_infos[sys_var_name] = array_info
+            is_float_array, array_length = array_info
+            if (index + len(value)) <= array_length:
+                new_values = [float(v) for v in value] if is_float_array else value
+                if index == 0 and len(value) == array_length:
+                    final_value = tuple(new_values)
                 else:
-                    final_value[index: index + len(value)] = value
-                variable_com_object.Value = tuple(final_value)
+                    if existing_variable_value is None:
+                        existing_variable_value = variable_com_object.Value
+                    final_value = list(existing_variable_value)
+                    final_value[index: index + len(value)] = new_values
+                    final_value = tuple(final_value)
+                variable_com_object.Value = final_value
                 wait(0.1)
-                self.__log.debug(f'👉 system variable({sys_var_name}) value set to {variable_com_object.Value}')
+                if self.__log_debug_enabled:
+                    self.__log.debug('👉 system variable(%s) value set to %s', sys_var_name, variable_com_object.Value)
             else:
                 self.__log.warning(f'⚠️ failed to set system variable({sys_var_name}) value. check variable length and index value')
         except Exception as e:
             self.__log.error(f'😡 failed to set system variable({sys_var_name}) value. {e}')
 
-    def send_diag_request(self, diag_ecu_qualifier_name: str, request: str, request_in_bytes=True, return_sender_name=False) -> Union[str, dict]:
+    def send_diag_request(self, diag_ecu_qualifier_name: str, request: str, request_in_bytes=True, return_sender_name=False, timeout=60) -> Union[str, dict]:
         """The send_diag_request method represents the query of a diagnostic tester (client) to an ECU (server) in CANoe.
 
         Args:
@@ -983,39 +1437,108 @@ class CANoe:
             request (str): Diagnostic request in bytes or diagnostic request qualifier name.
             request_in_bytes (bool): True if Diagnostic request is bytes. False if you are using Qualifier name. Default is True.
             return_sender_name (bool): True if you user want response along with response sender name in dictionary. Default is False.
+            timeout (int, optional): maximum time in seconds to wait for the response. Defaults to 60.
 
         Returns:
             diagnostic response stream. Ex- "50 01 00 00 00 00" or {'Door': "50 01 00 00 00 00"}
         """
-        diag_response_data = ""
-        diag_response_including_sender_name = {}
         try:
-            if diag_ecu_qualifier_name in self.__diag_devices.keys():
-                self.__log.debug(f'💉 {diag_ecu_qualifier_name}: Diagnostic Request 🟰 {request}')
-                if request_in_bytes:
-                    diag_req = self.__diag_devices[diag_ecu_qualifier_name].create_request_from_stream(request)
-                else:
-                    diag_req = self.__diag_devices[diag_ecu_qualifier_name].create_request(request)
-                diag_req.send()
-                while diag_req.pending:
-                    wait(0.1)
-                diag_req_responses = diag_req.responses
-                if len(diag_req_responses) == 0:
-                    self.__log.warning("🙅 Diagnostic Response Not Received 🔴")
-                else:
-                    for diag_res in diag_req_responses:
-                        diag_response_data = diag_res.stream
-                        diag_response_including_sender_name[diag_res.sender] = diag_response_data
-                        if diag_res.positive:
-                            self.__log.debug(f"🟢 {diag_res.sender}: ➕ Diagnostic Response 👉 {diag_response_data}")
-                        else:
-                            self.__log.debug(f"🔴 {diag_res.Sender}: ➖ Diagnostic Response 👉 {diag_response_data}")
-            else:
-                self.__log.warning(f'⚠️ Diagnostic ECU qualifier({diag_ecu_qualifier_name}) not available in loaded CANoe config')
+            diag_req = self.__start_diag_request(diag_ecu_qualifier_name, request, request_in_bytes)
+            if diag_req is not None and not diag_req.wait_for_response(timeout):
+                self.__log.warning('⌛ %s: diagnostic response timeout(%s s) for request %s', diag_ecu_qualifier_name, timeout, request)
+            return self.__read_diag_responses(diag_req, return_sender_name)
         except Exception as e:
             self.__log.error(f'😡 failed to send diagnostic request({request}). {e}')
+            return {} if return_sender_name else ""
+
+    async def send_diag_request_async(self, diag_ecu_qualifier_name: str, request: str, request_in_bytes=True, return_sender_name=False, timeout=60) -> Union[str, dict]:
+        """same as send_diag_request but yields to the asyncio event loop while waiting for the response.
+        requests to several ECUs can be awaited together with asyncio.gather. all of them are sent before the first wait.
+
+        Args:
+            diag_ecu_qualifier_name (str): Diagnostic Node ECU Qualifier Name configured in "Diagnostic/ISO TP Configuration".
+            request (str): Diagnostic request in bytes or diagnostic request qualifier name.
+            request_in_bytes (bool): True if Diagnostic request is bytes. False if you are using Qualifier name. Default is True.
+            return_sender_name (bool): True if you user want response along with response sender name in dictionary. Default is False.
+            timeout (int, optional): maximum time in seconds to wait for the response. Defaults to 60.
+
+        Returns:
+            diagnostic response stream. Ex- "50 01 00 00 00 00" or {'Door': "50 01 00 00 00 00"}
+        """
+        try:
+            diag_req = self.__start_diag_request(diag_ecu_qualifier_name, request, request_in_bytes)
+            if diag_req is not None and not await diag_req.wait_for_response_async(timeout):
+                self.__log.warning('⌛ %s: diagnostic response timeout(%s s) for request %s', diag_ecu_qualifier_name, timeout, request)
+            return self.__read_diag_responses(diag_req, return_sender_name)
+        except Exception as e:
+            self.__log.error(f'😡 failed to send diagnostic request({request}). {e}')
+            return {} if return_sender_name else ""
+
+    def __start_diag_request(self, diag_ecu_qualifier_name: str, request: str, request_in_bytes: bool):
+        diag_device = self.__diag_devices.get(diag_ecu_qualifier_name)
+        if diag_device is None:
+            self.__log.warning(f'⚠️ Diagnostic ECU qualifier({diag_ecu_qualifier_name}) not available in loaded CANoe config')
+            return None
+        self.__log.debug('💉 %s: Diagnostic Request 🟰 %s', diag_ecu_qualifier_name, request)
+        diag_req = self.__get_diag_request(diag_device, diag_ecu_qualifier_name, request, request_in_bytes)
+        try:
+            diag_req.send()
+        except pythoncom.com_error as e:
+            # pooled request object may not be usable anymore. it is dropped and sent once more with a new request object.
+            self.__log.debug('🔁 %s: resending diagnostic request %s with a new request object. %s', diag_ecu_qualifier_name, request, e)
+            self.__diag_request_pool.pop((diag_ecu_qualifier_name, request, request_in_bytes), None)
+            diag_req = self.__get_diag_request(diag_device, diag_ecu_qualifier_name, request, request_in_bytes)
+            diag_req.send()
+        return diag_req
+
+    def __read_diag_responses(self, diag_req, return_sender_name: bool) -> Union[str, dict]:
+        diag_response_data = ""
+        diag_response_including_sender_name = {}
+        if diag_req is not None:
+            diag_req_responses = diag_req.responses
+            if len(diag_req_responses) == 0:
+                self.__log.warning("🙅 Diagnostic Response Not Received 🔴")
+            else:
+                for diag_res in diag_req_responses:
+                    if not (return_sender_name or self.__log_debug_enabled):
+                        diag_response_data = diag_res.stream
+                        continue
+                    diag_response_data, diag_res_sender, diag_res_positive = diag_res.read_stream_sender_positive(self.__diag_response_dispids)
+                    if return_sender_name:
+                        diag_response_including_sender_name[diag_res_sender] = diag_response_data
+                    if not self.__log_debug_enabled:
+                        continue
+                    if diag_res_positive:
+                        self.__log.debug('🟢 %s: ➕ Diagnostic Response 👉 %s', diag_res_sender, diag_response_data)
+                    else:
+                        self.__log.debug('🔴 %s: ➖ Diagnostic Response 👉 %s', diag_res_sender, diag_response_data)
         return diag_response_including_sender_name if return_sender_name else diag_response_data
 
+    def __get_diag_request(self, diag_device, diag_ecu_qualifier_name: str, request: str, request_in_bytes: bool):
+        if self.__diag_request_pool_measurement != CANoe.CANOE_MEASUREMENT_INIT_COUNT:
+            # request objects belong to the measurement they were created in.
+            self.__diag_request_pool.clear()
+            self.__diag_request_pool_measurement = CANoe.CANOE_MEASUREMENT_INIT_COUNT
+        request_key = (diag_ecu_qualifier_name, request, request_in_bytes)
+        diag_req = self.__diag_request_pool.get(request_key)
+        if diag_req is None:
+            diag_req = self.__create_diag_request(diag_device, request, request_in_bytes)
+            self.__diag_request_pool[request_key] = diag_req
+            if len(self.__diag_request_pool) > CANoe.DIAG_REQUEST_POOL_SIZE:
+                self.__diag_request_pool.popitem(last=False)
+        elif diag_req.pending:
+            # same request is still in flight (ex- send_diag_request_async with asyncio.gather). pooled object is not shared.
+            diag_req = self.__create_diag_request(diag_device, request, request_in_bytes)
+        else:
+            self.__diag_request_pool.move_to_end(request_key)
+        return diag_req
+
+    @staticmethod
+    def __create_diag_request(diag_device, request: str, request_in_bytes: bool):
+        if request_in_bytes:
+            return diag_device.create_request_from_stream(request)
+        return diag_device.create_request(request)
+
     def control_tester_present(self, diag_ecu_qualifier_name: str, value: bool) -> None:
         """Starts/Stops sending autonomous/cyclical Tester Present requests to the ECU.
 
@@ -1024,15 +1547,15 @@ class CANoe:
             value (bool): True - activate tester present. False - deactivate tester present.
         """
         try:
-            if diag_ecu_qualifier_name in self.__diag_devices.keys():
-                diag_device = self.__diag_devices[diag_ecu_qualifier_name]
+            diag_device = self.__diag_devices.get(diag_ecu_qualifier_name)
+            if diag_device is not None:
                 if diag_device.tester_present_status != value:
                     if value:
                         diag_device.start_tester_present()
-                        self.__log.debug(f'⏱️🏃‍♂️‍ {diag_ecu_qualifier_name}: started tester present')
+                        self.__log.debug('⏱️🏃‍♂️‍ %s: started tester present', diag_ecu_qualifier_name)
                     else:
                         diag_device.stop_tester_present()
-                        self.__log.debug(f'⏱️🧍‍♂️ {diag_ecu_qualifier_name}: stopped tester present')
+                        self.__log.debug('⏱️🧍‍♂️ %s: stopped tester present', diag_ecu_qualifier_name)
                     wait(.1)
                 else:
                     self.__log.warning(f'⚠️ {diag_ecu_qualifier_name}: tester present already set to {value}')
@@ -1041,6 +1564,34 @@ class CANoe:
         except Exception as e:
             self.__log.error(f'😡 failed to control tester present. {e}')
 
+    def control_tester_present_bulk(self, tester_present_values: dict) -> None:
+        """Starts/Stops sending Tester Present requests for several ECUs in one go.
+
+        Args:
+            tester_present_values (dict): ECU qualifier name as key and tester present state as value. Ex- {'Door': True, 'Engine': False}
+        """
+        try:
+            state_changed = False
+            for diag_ecu_qualifier_name, value in tester_present_values.items():
+                diag_device = self.__diag_devices.get(diag_ecu_qualifier_name)
+                if diag_device is None:
+                    self.__log.error(f'😇 diag ECU qualifier "{diag_ecu_qualifier_name}" not available in configuration')
+                    continue
+                if diag_device.tester_present_status == value:
+                    self.__log.warning(f'⚠️ {diag_ecu_qualifier_name}: tester present already set to {value}')
+                    continue
+                if value:
+                    diag_device.start_tester_present()
+                    self.__log.debug('⏱️🏃‍♂️‍ %s: started tester present', diag_ecu_qualifier_name)
+                else:
+                    diag_device.stop_tester_present()
+                    self.__log.debug('⏱️🧍‍♂️ %s: stopped tester present', diag_ecu_qualifier_name)
+                state_changed = True
+            if state_changed:
+                wait(.1)
+        except Exception as e:
+            self.__log.error(f'😡 failed to control tester present. {e}')
+
     def set_replay_block_file(self, block_name: str, recording_file_path: str) -> None:
         """Method for setting CANoe replay block file.
 
@@ -1049,13 +1600,12 @@ class CANoe:
             recording_file_path: CANoe replay recording file including path.
         """
         try:
-            replay_blocks = self.__replay_blocks
-            if block_name in replay_blocks.keys():
-                replay_block = replay_blocks[block_name]
+            replay_block = self.__replay_blocks.get(block_name)
+            if replay_block is not None:
                 replay_block.path = recording_file_path
-                self.__log.debug(f'👉 Replay block "{block_name}" updated with "{recording_file_path}" path')
+                self.__log.debug('👉 Replay block "%s" updated with "%s" path', block_name, recording_file_path)
             else:
-                self.__log.warning(f'⚠️ Replay block "{block_name}" not available')
+                self.__log.warning('⚠️ Replay block "%s" not available', block_name)
         except Exception as e:
             self.__log.error(f'😡 failed to set replay block file. {e}')
 
@@ -1067,16 +1617,15 @@ class CANoe:
             start_stop (bool): True to start replay block. False to Stop.
         """
         try:
-            replay_blocks = self.__replay_blocks
-            if block_name in replay_blocks.keys():
-                replay_block = replay_blocks[block_name]
+            replay_block = self.__replay_blocks.get(block_name)
+            if replay_block is not None:
                 if start_stop:
                     replay_block.start()
                 else:
                     replay_block.stop()
-                self.__log.debug(f'👉 Replay block "{block_name}" {"Started" if start_stop else "Stopped"}')
+                self.__log.debug('👉 Replay block "%s" %s', block_name, 'Started' if start_stop else 'Stopped')
             else:
-                self.__log.warning(f'⚠️ Replay block "{block_name}" not available')
+                self.__log.warning('⚠️ Replay block "%s" not available', block_name)
         except Exception as e:
             self.__log.error(f'😡 failed to control replay block. {e}')
 
@@ -1084,10 +1633,20 @@ class CANoe:
         """compiles all CAPL, XML and .NET nodes."""
         try:
             capl_obj = self.capl_obj()
+            # result of the previous compile is still readable until the new one is finished.
+            # polling stops early only when the result changes. otherwise it is read after CAPL_COMPILE_TIMEOUT.
+            previous_compile_result = capl_obj.compile_result()
             capl_obj.compile()
-            wait(1)
-            compile_result = capl_obj.compile_result()
-            self.__log.debug(f'🧑‍💻 compiled all CAPL nodes successfully. result={compile_result["result"]}')
+            deadline = monotonic() + CANoe.CAPL_COMPILE_TIMEOUT
+            while True:
+                wait(CANoe.CAPL_COMPILE_POLL_INTERVAL)
+                compile_result = capl_obj.compile_result()
+                if compile_result != previous_compile_result or monotonic() > deadline:
+                    break
+            if compile_result['result'] == 0:
+                self.__log.debug('🧑‍💻 compiled all CAPL nodes successfully. result=%s', compile_result['result'])
+            else:
+                self.__log.warning('⚠️ compiling CAPL nodes failed. result=%s node=%s error=%s', compile_result['result'], compile_result['node_name'], compile_result['error_message'])
             return compile_result
         except Exception as e:
             self.__log.error(f'😡 failed to compile all CAPL nodes. {e}')
@@ -1106,9 +1665,13 @@ class CANoe:
             bool: CAPL function execution status. True-success, False-failed.
         """
         try:
+            capl_function_obj = CanoeMeasurementEvents.user_capl_function_obj_dict.get(name)
+            if capl_function_obj is None:
+                self.__log.warning(f'⚠️ CAPL function({name}) not available. pass its name in user_capl_functions during CANoe instance creation')
+                return False
             capl_obj = self.capl_obj()
-            exec_sts = capl_obj.call_capl_function(CanoeMeasurementEvents.user_capl_function_obj_dict[name], *arguments)
-            self.__log.debug(f'🛫 triggered capl function({name}). execution status 🟰 {exec_sts}')
+            exec_sts = capl_obj.call_capl_function(capl_function_obj, *arguments)
+            self.__log.debug('🛫 triggered capl function(%s). execution status 🟰 %s', name, exec_sts)
             return exec_sts
         except Exception as e:
             self.__log.error(f'😡 failed to call capl function({name}). {e}')
@@ -1131,8 +1694,9 @@ class CANoe:
         try:
             test_environments = self.get_test_environments()
             if len(test_environments) > 0:
-                if env_name in test_environments.keys():
-                    return test_environments[env_name].get_all_test_modules()
+                test_environment = test_environments.get(env_name)
+                if test_environment is not None:
+                    return test_environment.get_all_test_modules()
                 else:
                     self.__log.warning(f'⚠️ "{env_name}" not found in configuration')
                     return {}
@@ -1153,38 +1717,31 @@ class CANoe:
             int: test module execution verdict. 0 ='VerdictNotAvailable', 1 = 'VerdictPassed', 2 = 'VerdictFailed',
         """
         try:
-            test_verdict = {0: 'NotAvailable',
-                            1: 'Passed',
-                            2: 'Failed',
-                            3: 'None (not available for test modules)',
-                            4: 'Inconclusive (not available for test modules)',
-                            5: 'ErrorInTestSystem (not available for test modules)', }
-            execution_result = 0
-            test_module_found = False
-            test_env_name = ''
-            for tm in self.__test_modules:
-                if tm['name'] == test_module_name:
-                    test_module_found = True
-                    tm_obj = tm['object']
-                    test_env_name = tm['environment']
-                    self.__log.debug(f'🔎 test module "{test_module_name}" found in "{test_env_name}"')
-                    tm_obj.start()
-                    tm_obj.wait_for_completion()
-                    execution_result = tm_obj.verdict
-                    break
-                else:
-                    continue
-            if test_module_found and (execution_result == 1):
-                self.__log.debug(f'✔️ test module "{test_env_name}.{test_module_name}" executed and verdict 🟰 {test_verdict[execution_result]}')
-            elif test_module_found and (execution_result != 1):
-                self.__log.debug(f'😵‍💫 test module "{test_env_name}.{test_module_name}" executed and verdict 🟰 {test_verdict[execution_result]}')
-            else:
+            test_modules = self.__test_modules_by_name.get(test_module_name)
+            if not test_modules:
                 self.__log.warning(f'⚠️ test module "{test_module_name}" not found. not possible to execute')
-            return execution_result
+                return 0
+            tm = test_modules[0]
+            self.__log.debug('🔎 test module "%s" found in "%s"', test_module_name, tm['environment'])
+            return self.__execute_test_module(tm)
         except Exception as e:
             self.__log.error(f'😡 failed to execute test module. {e}')
             return 0
 
+    def __execute_test_module(self, tm: dict) -> int:
+        tm_obj = tm['object']
+        tm_obj.start()
+        tm_obj.wait_for_completion()
+        execution_result = tm_obj.verdict
+        self.__log_test_module_verdict(tm, execution_result)
+        return execution_result
+
+    def __log_test_module_verdict(self, tm: dict, execution_result: int) -> None:
+        if execution_result == 1:
+            self.__log.debug('✔️ test module "%s.%s" executed and verdict 🟰 %s', tm['environment'], tm['name'], CANoe.TEST_VERDICTS[execution_result])
+        else:
+            self.__log.debug('😵‍💫 test module "%s.%s" executed and verdict 🟰 %s', tm['environment'], tm['name'], CANoe.TEST_VERDICTS[execution_result])
+
     def stop_test_module(self, test_module_name: str):
         """stops execution of test module.
 
@@ -1192,8 +1749,9 @@ class CANoe:
             test_module_name (str): test module name. avoid duplicate test module names in CANoe configuration.
         """
         try:
-            for tm in self.__test_modules:
-                if tm['name'] == test_module_name:
+            test_modules = self.__test_modules_by_name.get(test_module_name)
+            if test_modules:
+                for tm in test_modules:
                     tm['object'].stop()
                     test_env_name = tm['environment']
                     self.__log.debug(f'👉 test module "{test_module_name}" in test environment "{test_env_name}" stopped 🧍‍♂️')
@@ -1202,22 +1760,34 @@ class CANoe:
         except Exception as e:
             self.__log.error(f'😡 failed to stop test module. {e}')
 
-    def execute_all_test_modules_in_test_env(self, env_name: str):
+    def execute_all_test_modules_in_test_env(self, env_name: str, parallel=False):
         """executes all test modules available in test environment.
 
         Args:
             env_name (str): test environment name. avoid duplicate test environment names in CANoe configuration.
+            parallel (bool): True to start all test modules first and then wait for their completion. Defaults to False.
         """
         try:
-            test_modules = self.get_test_modules(env_name=env_name)
+            test_modules = [tm for tm in self.__test_modules if tm['environment'] == env_name]
             if test_modules:
-                for tm_name in test_modules.keys():
-                    self.execute_test_module(tm_name)
+                if parallel:
+                    self.__execute_test_modules_in_parallel(test_modules)
+                else:
+                    for tm in test_modules:
+                        self.__execute_test_module(tm)
             else:
                 self.__log.warning(f'⚠️ test modules not available in "{env_name}" test environment')
         except Exception as e:
             self.__log.error(f'😡 failed to execute all test modules in "{env_name}" test environment. {e}')
 
+    def __execute_test_modules_in_parallel(self, test_modules) -> None:
+        for tm in test_modules:
+            tm['object'].start()
+        for tm in test_modules:
+            tm_obj = tm['object']
+            tm_obj.wait_for_completion()
+            self.__log_test_module_verdict(tm, tm_obj.verdict)
+
     def stop_all_test_modules_in_test_env(self, env_name: str):
         """stops execution of all test modules available in test environment.
 
@@ -1227,19 +1797,25 @@ class CANoe:
         try:
             test_modules = self.get_test_modules(env_name=env_name)
             if test_modules:
-                for tm_name in test_modules.keys():
+                for tm_name in test_modules:
                     self.stop_test_module(env_name, tm_name)
             else:
                 self.__log.warning(f'⚠️ test modules not available in "{env_name}" test environment')
         except Exception as e:
             self.__log.error(f'😡 failed to stop all test modules in "{env_name}" test environment. {e}')
 
-    def execute_all_test_environments(self):
-        """executes all test environments available in test setup."""
+    def execute_all_test_environments(self, parallel=False):
+        """executes all test environments available in test setup.
+
+        Args:
+            parallel (bool): True to start test modules of all test environments first and then wait for their completion. Defaults to False.
+        """
         try:
             test_environments = self.get_test_environments()
-            if len(test_environments) > 0:
-                for test_env_name in test_environments.keys():
+            if len(test_environments) > 0 and parallel:
+                self.__execute_test_modules_in_parallel(self.__test_modules)
+            elif len(test_environments) > 0:
+                for test_env_name in test_environments:
                     self.__log.debug(f'🏃‍♂️ started executing test environment "{test_env_name}"')
                     self.execute_all_test_modules_in_test_env(test_env_name)
                     self.__log.debug(f'✔️ completed executing test environment "{test_env_name}"')
@@ -1253,7 +1829,7 @@ class CANoe:
         try:
             test_environments = self.get_test_environments()
             if len(test_environments) > 0:
-                for test_env_name in test_environments.keys():
+                for test_env_name in test_environments:
                     self.__log.debug(f'⏹️ stopping test environment "{test_env_name}" execution')
                     self.stop_all_test_modules_in_test_env(test_env_name)
                     self.__log.debug(f'✔️ completed stopping test environment "{test_env_name}"')
@@ -1272,12 +1848,16 @@ class CANoe:
             Environment Variable value.
         """
         var_value = None
-        try:
-            variable = self.environment_obj_inst.get_variable(env_var_name)
-            var_value = variable.value if variable.type != 3 else tuple(variable.value)
-            self.__log.debug(f'👉 environment variable({env_var_name}) value 🟰 {var_value}')
-        except Exception as e:
-            self.__log.error(f'😡 failed to get environment variable({env_var_name}) value. {e}')
+        variable = self.__get_environment_variable(env_var_name)
+        if variable is None:
+            self.__log.warning(f'⚠️ environment variable({env_var_name}) not available in loaded CANoe config')
+            return var_value
+        try:
+            var_value = self.__read_environment_variable(variable)
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 environment variable(%s) value 🟰 %s', env_var_name, var_value)
+        except (pythoncom.com_error, TypeError, ValueError) as e:
+            self.__log.error('😡 failed to get environment variable(%s) value. %s', env_var_name, e)
         return var_value
 
     def set_environment_variable_value(self, env_var_name: str, value: Union[int, float, str, tuple]) -> None:
@@ -1287,20 +1867,121 @@ class CANoe:
             env_var_name (str): The name of the environment variable. Ex- "speed".
             value (Union[int, float, str, tuple]): variable value. supported CAPL environment variable data types integer, double, string and data.
         """
+        variable = self.__get_environment_variable(env_var_name)
+        if variable is None:
+            self.__log.warning(f'⚠️ environment variable({env_var_name}) not available in loaded CANoe config')
+            return
         try:
-            variable = self.environment_obj_inst.get_variable(env_var_name)
-            if variable.type == 0:
-                converted_value = int(value)
-            elif variable.type == 1:
-                converted_value = float(value)
-            elif variable.type == 2:
-                converted_value = str(value)
-            else:
-                converted_value = tuple(value)
-            variable.value = converted_value
-            self.__log.debug(f'👉 environment variable({env_var_name}) value 🟰 {converted_value}')
-        except Exception as e:
-            self.__log.error(f'😡 failed to set system variable({env_var_name}) value. {e}')
+            converted_value = self.__write_environment_variable(variable, value)
+            wait(.1)
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 environment variable(%s) value 🟰 %s', env_var_name, converted_value)
+        except (pythoncom.com_error, TypeError, ValueError) as e:
+            self.__log.error('😡 failed to set environment variable(%s) value. %s', env_var_name, e)
+
+    def get_environment_variable_value_as_bytes(self, env_var_name: str) -> Union[bytes, None]:
+        """returns value of a data environment variable as bytes.
+
+        Args:
+            env_var_name (str): The name of the data environment variable. Ex- "data_var"
+
+        Returns:
+            Environment Variable value as bytes. None if variable is not a data variable or reading failed.
+        """
+        variable = self.__get_environment_variable(env_var_name)
+        if variable is None:
+            self.__log.warning(f'⚠️ environment variable({env_var_name}) not available in loaded CANoe config')
+            return None
+        try:
+            if variable.type != 3:
+                self.__log.warning(f'⚠️ environment variable({env_var_name}) is not a data variable')
+                return None
+            var_value = bytes(variable.value)
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 environment variable(%s) value 🟰 %s', env_var_name, var_value)
+            return var_value
+        except (pythoncom.com_error, TypeError, ValueError) as e:
+            self.__log.error('😡 failed to get environment variable(%s) value. %s', env_var_name, e)
+            return None
+
+    def set_environment_variable_value_from_bytes(self, env_var_name: str, value: Union[bytes, bytearray]) -> None:
+        """sets bytes to a data environment variable without converting them element by element.
+
+        Args:
+            env_var_name (str): The name of the data environment variable. Ex- "data_var"
+            value (Union[bytes, bytearray]): variable value.
+        """
+        variable = self.__get_environment_variable(env_var_name)
+        if variable is None:
+            self.__log.warning(f'⚠️ environment variable({env_var_name}) not available in loaded CANoe config')
+            return
+        try:
+            if variable.type != 3:
+                self.__log.warning(f'⚠️ environment variable({env_var_name}) is not a data variable')
+                return
+            variable.value = bytes(value)
+            if self.__log_debug_enabled:
+                self.__log.debug('👉 environment variable(%s) value 🟰 %s', env_var_name, value)
+        except (pythoncom.com_error, TypeError, ValueError) as e:
+            self.__log.error('😡 failed to set environment variable(%s) value. %s', env_var_name, e)
+
+    def get_environment_variable_values(self, env_var_names) -> dict:
+        """returns values of several environment variables.
+
+        Args:
+            env_var_names (Iterable[str]): names of the environment variables. Ex- ("int_var", "float_var")
+
+        Returns:
+            dict of environment variable name and value. value is None if the variable is not available or reading it failed.
+        """
+        env_var_values = dict()
+        get_environment_variable = self.__get_environment_variable
+        read_environment_variable = self.__read_environment_variable
+        for env_var_name in env_var_names:
+            env_var_values[env_var_name] = None
+            variable = get_environment_variable(env_var_name)
+            if variable is None:
+                self.__log.warning(f'⚠️ environment variable({env_var_name}) not available in loaded CANoe config')
+                continue
+            try:
+                env_var_values[env_var_name] = read_environment_variable(variable)
+            except (pythoncom.com_error, TypeError, ValueError) as e:
+                self.__log.error('😡 failed to get environment variable(%s) value. %s', env_var_name, e)
+        self.__log.debug('👉 values of %s environment variables 🟰 %s', len(env_var_values), env_var_values)
+        return env_var_values
+
+    def set_environment_variable_values(self, env_var_values: dict) -> None:
+        """sets values of several environment variables.
+
+        Args:
+            env_var_values (dict): environment variable name and value pairs. Ex- {"int_var": 12, "string_var": "hello"}
+        """
+        get_environment_variable = self.__get_environment_variable
+        write_environment_variable = self.__write_environment_variable
+        for env_var_name, value in env_var_values.items():
+            variable = get_environment_variable(env_var_name)
+            if variable is None:
+                self.__log.warning(f'⚠️ environment variable({env_var_name}) not available in loaded CANoe config')
+                continue
+            try:
+                write_environment_variable(variable, value)
+            except (pythoncom.com_error, TypeError, ValueError) as e:
+                self.__log.error('😡 failed to set environment variable(%s) value. %s', env_var_name, e)
+        wait(.1)
+        self.__log.debug('👉 values set for %s environment variables', len(env_var_values))
+
+    @staticmethod
+    def __read_environment_variable(variable):
+        var_value = variable.value
+        if variable.type == 3 and not isinstance(var_value, tuple):
+            var_value = tuple(var_value)
+        return var_value
+
+    @staticmethod
+    def __write_environment_variable(variable, value):
+        converted_value = CanoeEnvironmentVariable.VALUE_CONVERTERS.get(variable.type, tuple)(value)
+        variable.com_obj.Value = converted_value
+        return converted_value
 
     def add_database(self, database_file: str, database_network: str, database_channel: int) -> bool:
         """adds database file to a network channel
@@ -1316,11 +1997,12 @@ class CANoe:
                 return False
             else:
                 databases = self.configuration_general_setup.database_setup.databases.fetch_databases()
-                if database_file in [database.full_name for database in databases.values()]:
+                if any(database.full_name == database_file for database in databases.values()):
                     self.__log.warning(f'⚠️ database "{database_file}" already added')
                     return False
                 else:
                     self.configuration_general_setup.database_setup.databases.add_network(database_file, database_network)
+                    self.__bus_databases_infos.clear()
                     wait(1)
                     databases = self.configuration_general_setup.database_setup.databases.fetch_databases()
                     for database in databases.values():
@@ -1346,7 +2028,7 @@ class CANoe:
                 return False
             else:
                 databases = self.configuration_general_setup.database_setup.databases
-                if database_file not in [database.full_name for database in databases.fetch_databases().values()]:
+                if not any(database.full_name == database_file for database in databases.fetch_databases().values()):
                     self.__log.warning(f'⚠️ database "{database_file}" not available to remove')
                     return False
                 else:
@@ -1354,6 +2036,7 @@ class CANoe:
                         database_com_obj = databases.com_obj.Item(i)
                         if database_com_obj.FullName == database_file and database_com_obj.Channel == database_channel:
                             self.configuration_general_setup.database_setup.databases.remove(i)
+                            self.__bus_databases_infos.clear()
                             wait(1)
                             self.__log.debug(f'👉 database "{database_file}" removed from channel {database_channel}')
                             return True
@@ -1364,37 +2047,31 @@ class CANoe:
 
 def DoApplicationEvents() -> None:
     pythoncom.PumpWaitingMessages()
-    wait(.1)
+    win32event.MsgWaitForMultipleObjects((), False, 100, win32event.QS_ALLINPUT)
 
 def DoApplicationEventsUntil(cond, timeout) -> None:
-    base_time = datetime.now()
+    deadline = monotonic() + timeout()
     while not cond():
         DoMeasurementEvents()
-        now = datetime.now()
-        difference = now - base_time
-        seconds = difference.seconds
-        if seconds > timeout():
-            logging.getLogger('CANOE_LOG').debug(f'⌛ application event timeout({timeout()} s)')
+        if monotonic() > deadline:
+            logging.getLogger('CANOE_LOG').debug('⌛ application event timeout(%s s)', timeout())
             break
 
 def DoMeasurementEvents() -> None:
     pythoncom.PumpWaitingMessages()
-    wait(.1)
+    win32event.MsgWaitForMultipleObjects((), False, 100, win32event.QS_ALLINPUT)
 
 def DoMeasurementEventsUntil(cond, timeout) -> None:
-    base_time = datetime.now()
+    deadline = monotonic() + timeout()
     while not cond():
         DoMeasurementEvents()
-        now = datetime.now()
-        difference = now - base_time
-        seconds = difference.seconds
-        if seconds > timeout():
-            logging.getLogger('CANOE_LOG').debug(f'⌛ measurement event timeout({timeout()} s)')
+        if monotonic() > deadline:
+            logging.getLogger('CANOE_LOG').debug('⌛ measurement event timeout(%s s)', timeout())
             break
 
 def DoTestModuleEvents():
     pythoncom.PumpWaitingMessages()
-    wait(.1)
+    win32event.MsgWaitForMultipleObjects((), False, 100, win32event.QS_ALLINPUT)
 
 def DoTestModuleEventsUntil(condition):
     while not condition():
@@ -1402,12 +2079,51 @@ def DoTestModuleEventsUntil(condition):
 
 def DoEnvVarEvents():
     pythoncom.PumpWaitingMessages()
-    wait(.1)
+    win32event.MsgWaitForMultipleObjects((), False, 100, win32event.QS_ALLINPUT)
 
 def DoEnvVarEventsUntil(condition):
     while not condition():
         DoEnvVarEvents()
 
+def DoDiagnosticRequestEvents(wait_ms=10) -> None:
+    pythoncom.PumpWaitingMessages()
+    win32event.MsgWaitForMultipleObjects((), False, wait_ms, win32event.QS_ALLINPUT)
+
+def DoDiagnosticRequestEventsUntil(condition, timeout) -> bool:
+    # fast responses are picked up after ~1 ms. the wait doubles up to 50 ms for slow ECUs.
+    deadline = monotonic() + timeout
+    wait_ms = 1
+    while not condition():
+        if monotonic() > deadline:
+            return False
+        DoDiagnosticRequestEvents(wait_ms)
+        wait_ms = min(wait_ms * 2, 50)
+    return True
+
+async def DoDiagnosticRequestEventsUntilAsync(condition, timeout) -> bool:
+    deadline = monotonic() + timeout
+    wait_s = 0.001
+    while not condition():
+        if monotonic() > deadline:
+            return False
+        pythoncom.PumpWaitingMessages()
+        await asyncio.sleep(wait_s)
+        wait_s = min(wait_s * 2, 0.05)
+    return True
+
+def GetComPropertyValues(com_obj, property_names: tuple, dispids: dict) -> tuple:
+    """reads several COM properties with one IDispatch Invoke each.
+    DISPIDs are looked up once and stored in dispids so objects of the same type can share them.
+    """
+    ole_obj = getattr(com_obj, '_oleobj_', com_obj)
+    values = list()
+    for property_name in property_names:
+        dispid = dispids.get(property_name)
+        if dispid is None:
+            dispid = dispids[property_name] = ole_obj.GetIDsOfNames(property_name)
+        values.append(ole_obj.Invoke(dispid, 0, pythoncom.DISPATCH_PROPERTYGET, True))
+    return tuple(values)
+
 
 class CanoeApplicationEvents:
     """Handler for CANoe Application events"""
@@ -1427,6 +2143,7 @@ class CanoeCapl:
     Additionally, it represents the CAPL functions available in the CAPL programs.
     Please note that only user-defined CAPL functions can be accessed
     """
+    __slots__ = ('__log', 'com_obj')
     def __init__(self, application_com_obj):
         try:
             self.__log = logging.getLogger('CANOE_LOG')
@@ -1465,7 +2182,7 @@ class CanoeCapl:
         compile_result_obj = self.com_obj.CompileResult
         return_values['error_message'] = compile_result_obj.ErrorMessage
         return_values['node_name'] = compile_result_obj.NodeName
-        return_values['result'] = compile_result_obj.result
+        return_values['result'] = compile_result_obj.Result
         return_values['source_file'] = compile_result_obj.SourceFile
         return return_values
 
@@ -1483,6 +2200,7 @@ class CanoeConfigurationEvents:
 
 class CanoeConfigurationGeneralSetup:
     """The GeneralSetup object represents the general settings of a CANoe configuration."""
+    __slots__ = ('__log', 'com_obj')
     def __init__(self, configuration_com_obj) -> None:
         try:
             self.__log = logging.getLogger('CANOE_LOG')
@@ -1503,6 +2221,7 @@ class CanoeConfigurationGeneralSetupDatabaseSetupEvents:
 
 class CanoeConfigurationGeneralSetupDatabaseSetup:
     """The DatabaseSetup object represents the assigned databases of the current configuration."""
+    __slots__ = ('__log', 'com_obj')
     def __init__(self, general_setup_com_obj):
         try:
             self.__log = logging.getLogger('CANOE_LOG')
@@ -1517,6 +2236,7 @@ class CanoeConfigurationGeneralSetupDatabaseSetup:
 
 class CanoeConfigurationGeneralSetupDatabaseSetupDatabases:
     """The Databases object represents the assigned databases of CANoe."""
+    __slots__ = ('__log', 'com_obj')
     def __init__(self, database_setup_com_obj):
         try:
             self.__log = logging.getLogger('CANOE_LOG')
@@ -1548,6 +2268,7 @@ class CanoeConfigurationGeneralSetupDatabaseSetupDatabases:
 
 class CanoeConfigurationGeneralSetupDatabaseSetupDatabasesDatabase:
     """The Database object represents the assigned database of the CANoe application."""
+    __slots__ = ('__log', 'com_obj')
     def __init__(self, database_com_obj):
         try:
             self.__log = logging.getLogger('CANOE_LOG')
@@ -1582,6 +2303,7 @@ class CanoeConfigurationGeneralSetupDatabaseSetupDatabasesDatabase:
 
 class CanoeConfigurationSimulationSetup:
     """The SimulationSetup object represents the Simulation Setup of CANoe."""
+    __slots__ = ('__log', 'com_obj')
     def __init__(self, configuration_com_obj):
         try:
             self.__log = logging.getLogger('CANOE_LOG')
@@ -1604,6 +2326,7 @@ class CanoeConfigurationSimulationSetup:
 
 class CanoeConfigurationSimulationSetupReplayCollection:
     """The ReplayCollection object represents the Replay Blocks of the CANoe application."""
+    __slots__ = ('__log', 'com_obj')
     def __init__(self, sim_setup_com_obj):
         try:
             self.__log = logging.getLogger('CANOE_LOG')
@@ -1622,15 +2345,17 @@ class CanoeConfigurationSimulationSetupReplayCollection:
         self.com_obj.Remove(index)
 
     def fetch_replay_blocks(self) -> dict:
-        replay_blocks = dict()
+        return dict(self.iter_replay_blocks())
+
+    def iter_replay_blocks(self):
+        """yields (replay block name, replay block object) pairs without reading the whole collection upfront."""
         for index in range(1, self.count + 1):
-            rb_com_obj = self.com_obj.Item(index)
-            rb_inst = CanoeConfigurationSimulationSetupReplayCollectionReplayBlock(rb_com_obj)
-            replay_blocks[rb_inst.name] = rb_inst
-        return replay_blocks
+            rb_inst = CanoeConfigurationSimulationSetupReplayCollectionReplayBlock(self.com_obj.Item(index))
+            yield rb_inst.name, rb_inst
 
 
 class CanoeConfigurationSimulationSetupReplayCollectionReplayBlock:
+    __slots__ = ('__log', 'com_obj')
     def __init__(self, replay_block_com_obj):
         try:
             self.__log = logging.getLogger('CANOE_LOG')
@@ -1661,6 +2386,7 @@ class CanoeConfigurationSimulationSetupBuses:
     """The Buses object represents the buses of the Simulation Setup of the CANoe application.
     The Buses object is only available in CANoe.
     """
+    __slots__ = ('__log', 'com_obj')
     def __init__(self, sim_setup_com_obj):
         try:
             self.__log = logging.getLogger('CANOE_LOG')
@@ -1677,6 +2403,7 @@ class CanoeConfigurationSimulationSetupNodes:
     """The Nodes object represents the CAPL node of the Simulation Setup of the CANoe application.
     The Nodes object is only available in CANoe.
     """
+    __slots__ = ('__log', 'com_obj')
     def __init__(self, sim_setup_com_obj):
         try:
             self.__log = logging.getLogger('CANOE_LOG')
@@ -1691,6 +2418,7 @@ class CanoeConfigurationSimulationSetupNodes:
 
 class CanoeConfigurationTestSetup:
     """The TestSetup object represents CANoe's test setup."""
+    __slots__ = ('__log', 'com_obj')
     def __init__(self, conf_com_obj):
         try:
             self.__log = logging.getLogger('CANOE_LOG')
@@ -1707,6 +2435,7 @@ class CanoeConfigurationTestSetup:
 
 
 class CanoeConfigurationTestSetupTestEnvironments:
+    __slots__ = ('__log', 'com_obj')
     def __init__(self, test_setup_com_obj):
         try:
             self.__log = logging.getLogger('CANOE_LOG')
@@ -1735,6 +2464,7 @@ class CanoeConfigurationTestSetupTestEnvironments:
 
 class CanoeConfigurationTestSetupTestEnvironmentsTestEnvironment:
     """The TestEnvironment object represents a test environment within CANoe's test setup."""
+    __slots__ = ('com_obj', '__test_modules')
     def __init__(self, test_environment_com_obj):
         self.com_obj = test_environment_com_obj
         self.__test_modules = CanoeConfigurationTestSetupTestEnvironmentsTestEnvironmentTestModules(self.com_obj)
@@ -1779,6 +2509,7 @@ class CanoeConfigurationTestSetupTestEnvironmentsTestEnvironmentTestModules:
     """The TestModules object represents the test modules in a test environment or in a test setup folder.
     This object should be preferred to the TestSetupItems object.
     """
+    __slots__ = ('com_obj',)
 
     def __init__(self, test_env_com_obj) -> None:
         self.com_obj = test_env_com_obj.TestModules
@@ -1827,7 +2558,7 @@ class CanoeConfigurationTestSetupTestEnvironmentsTestEnvironmentTestModulesTestM
         self.tm_html_report_path = generated_full_name
         self.tm_report_generated = success
         self.tm_running = False
-        logging.getLogger('CANOE_LOG').debug(f'👉test module OnReportGenerated event. {success} # {source_full_name} # {generated_full_name}')
+        logging.getLogger('CANOE_LOG').debug('👉test module OnReportGenerated event. %s # %s # %s', success, source_full_name, generated_full_name)
 
     def OnVerdictFail(self):
         # logging.getLogger('CANOE_LOG').debug(f'👉test module OnVerdictFail event')
@@ -1836,6 +2567,7 @@ class CanoeConfigurationTestSetupTestEnvironmentsTestEnvironmentTestModulesTestM
 
 class CanoeConfigurationTestSetupTestEnvironmentsTestEnvironmentTestModulesTestModule:
     """The TestModule object represents a test module in CANoe's test setup."""
+    __slots__ = ('__log', 'com_obj', 'wait_for_tm_to_start', 'wait_for_tm_to_stop', 'wait_for_tm_report_gen')
 
     def __init__(self, test_module_com_obj):
         try:
@@ -1871,7 +2603,10 @@ class CanoeConfigurationTestSetupTestEnvironmentsTestEnvironmentTestModulesTestM
     def wait_for_completion(self):
         self.wait_for_tm_to_stop()
         wait(1)
-        logging.getLogger('CANOE_LOG').debug(f'👉 completed executing test module. verdict = {self.verdict}')
+        log = logging.getLogger('CANOE_LOG')
+        # verdict is a COM read. only fetch it when the message is logged.
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('👉 completed executing test module. verdict = %s', self.verdict)
 
     def pause(self) -> None:
         self.com_obj.Pause()
@@ -1896,6 +2631,7 @@ class CanoeEnvironment:
     """The Environment class represents the environment variables.
     The Environment class is only available in CANoe
     """
+    __slots__ = ('__log', 'com_obj')
     def __init__(self, application_com_obj):
         try:
             self.__log = logging.getLogger('CANOE_LOG')
@@ -1923,6 +2659,7 @@ class CanoeEnvironmentGroup:
     """The EnvironmentGroup class represents a group of environment variables.
     With the help of environment variable groups you can set or query multiple environment variables simultaneously with just one call.
     """
+    __slots__ = ('com_obj',)
     def __init__(self, env_group_com_obj):
         self.com_obj = env_group_com_obj
 
@@ -1945,6 +2682,7 @@ class CanoeEnvironmentGroup:
 
 class CanoeEnvironmentArray:
     """The EnvironmentArray class represents an array of environment variables."""
+    __slots__ = ('com_obj',)
     def __init__(self, env_array_com_obj):
         self.com_obj = env_array_com_obj
 
@@ -1962,10 +2700,15 @@ class CanoeEnvironmentVariableEvents:
 
 
 class CanoeEnvironmentVariable:
+    __slots__ = ('__log', 'com_obj', '__type', 'wait_for_var_event')
+    # python converter per variable type. 0 = integer, 1 = float, 2 = string. data(3) variables use tuple.
+    VALUE_CONVERTERS = {0: int, 1: float, 2: str}
+
     def __init__(self, env_var_com_obj):
         try:
             self.__log = logging.getLogger('CANOE_LOG')
             self.com_obj = win32com.client.DispatchWithEvents(env_var_com_obj, CanoeEnvironmentVariableEvents)
+            self.__type = None
             self.wait_for_var_event = lambda: DoEnvVarEventsUntil(lambda: self.com_obj.var_event_occurred)
         except Exception as e:
             self.__log.error(f'😡 Error initializing EnvironmentVariable object: {str(e)}')
@@ -1988,7 +2731,10 @@ class CanoeEnvironmentVariable:
 
     @property
     def type(self):
-        return self.com_obj.Type
+        # type of an environment variable doesn't change. read it from COM only once.
+        if self.__type is None:
+            self.__type = self.com_obj.Type
+        return self.__type
 
     @property
     def value(self):
@@ -2001,6 +2747,7 @@ class CanoeEnvironmentVariable:
 
 
 class CanoeEnvironmentInfo:
+    __slots__ = ('com_obj',)
     def __init__(self, env_info_com_obj):
         self.com_obj = env_info_com_obj
 
@@ -2026,6 +2773,7 @@ class CanoeMeasurementEvents:
         application_com_obj_loc = CanoeMeasurementEvents.application_com_obj
         for fun in CanoeMeasurementEvents.user_capl_function_names:
             CanoeMeasurementEvents.user_capl_function_obj_dict[fun] = application_com_obj_loc.CAPL.GetFunction(fun)
+        CANoe.CANOE_MEASUREMENT_INIT_COUNT += 1
         CANoe.CANOE_MEASUREMENT_STARTED = False
         CANoe.CANOE_MEASUREMENT_STOPPED = False
 
@@ -2049,6 +2797,7 @@ class CanoeMeasurementEvents:
 
 class CanoeNetworks:
     """The Networks class represents the networks of CANoe."""
+    __slots__ = ('log', 'com_obj')
     def __init__(self, networks_com_obj):
         try:
             self.log = logging.getLogger('CANOE_LOG')
@@ -2069,21 +2818,22 @@ class CanoeNetworks:
         return networks
 
     def fetch_all_diag_devices(self) -> dict:
-        diag_devices = dict()
-        networks = self.fetch_all_networks()
-        if len(networks) > 0:
-            for _, n_value in networks.items():
-                devices = n_value.devices
-                n_devices = devices.get_all_devices()
-                if len(n_devices) > 0:
-                    for d_name, d_value in n_devices.items():
-                        if d_value.diagnostic is not None:
-                            diag_devices[d_name] = d_value.diagnostic
-        return diag_devices
+        return dict(self.iter_diag_devices())
+
+    def iter_diag_devices(self):
+        """yields (device name, diagnostic object) pairs network by network without reading the whole collection upfront."""
+        for n_index in range(1, self.count + 1):
+            devices = CanoeNetworksNetwork(win32com.client.Dispatch(self.com_obj.Item(n_index))).devices
+            for d_index in range(1, devices.count + 1):
+                device = CanoeNetworksNetworkDevicesDevice(devices.com_obj.Item(d_index))
+                d_diagnostic = device.diagnostic
+                if d_diagnostic is not None:
+                    yield device.name, d_diagnostic
 
 
 class CanoeNetworksNetwork:
     """The Network class represents one single network of CANoe."""
+    __slots__ = ('com_obj',)
     def __init__(self, network_com_obj):
         self.com_obj = network_com_obj
 
@@ -2102,6 +2852,7 @@ class CanoeNetworksNetwork:
 
 class CanoeNetworksNetworkDevices:
     """The Devices class represents all devices of CANoe."""
+    __slots__ = ('com_obj',)
     def __init__(self, network_com_obj):
         self.com_obj = network_com_obj.Devices
 
@@ -2120,6 +2871,7 @@ class CanoeNetworksNetworkDevices:
 
 class CanoeNetworksNetworkDevicesDevice:
     """The Device class represents one single device of CANoe."""
+    __slots__ = ('com_obj',)
     def __init__(self, device_com_obj):
         self.com_obj = device_com_obj
 
@@ -2140,6 +2892,7 @@ class CanoeNetworksNetworkDevicesDeviceDiagnostic:
     """The Diagnostic class represents the diagnostic properties of an ECU on the bus or the basic diagnostic functionality of a CANoe network.
     It is identified by the ECU qualifier that has been specified for the loaded diagnostic description (CDD/ODX).
     """
+    __slots__ = ('com_obj',)
     def __init__(self, diagnostic_com_obj):
         self.com_obj = diagnostic_com_obj
 
@@ -2151,10 +2904,7 @@ class CanoeNetworksNetworkDevicesDeviceDiagnostic:
         return CanoeNetworksNetworkDevicesDeviceDiagnosticRequest(self.com_obj.CreateRequest(primitive_path))
 
     def create_request_from_stream(self, byte_stream: str):
-        diag_req_in_bytes = bytearray()
-        byte_stream = ''.join(byte_stream.split(' '))
-        for i in range(0, len(byte_stream), 2):
-            diag_req_in_bytes.append(int(byte_stream[i:i + 2], 16))
+        diag_req_in_bytes = bytearray.fromhex(byte_stream)
         return CanoeNetworksNetworkDevicesDeviceDiagnosticRequest(self.com_obj.CreateRequestFromStream(diag_req_in_bytes))
 
     def start_tester_present(self) -> None:
@@ -2168,6 +2918,7 @@ class CanoeNetworksNetworkDevicesDeviceDiagnosticRequest:
     """The DiagnosticRequest class represents the query of a diagnostic tester (client) to an ECU (server) in CANoe.
     It can be replied by a DiagnosticResponse object.
     """
+    __slots__ = ('com_obj',)
     def __init__(self, diag_req_com_obj):
         self.com_obj = diag_req_com_obj
 
@@ -2178,7 +2929,7 @@ class CanoeNetworksNetworkDevicesDeviceDiagnosticRequest:
     @property
     def responses(self) -> list:
         diag_responses_com_obj = self.com_obj.Responses
-        diag_responses = [CanoeNetworksNetworkDevicesDeviceDiagnosticResponse(diag_responses_com_obj.item(i)) for i in range(1, diag_responses_com_obj.Count + 1)]
+        diag_responses = [CanoeNetworksNetworkDevicesDeviceDiagnosticResponse(diag_responses_com_obj.Item(i)) for i in range(1, diag_responses_com_obj.Count + 1)]
         return diag_responses
 
     @property
@@ -2188,6 +2939,16 @@ class CanoeNetworksNetworkDevicesDeviceDiagnosticRequest:
     def send(self):
         self.com_obj.Send()
 
+    def wait_for_response(self, timeout=60) -> bool:
+        """pumps COM messages until the request is no longer pending. returns False if still pending after timeout seconds."""
+        return DoDiagnosticRequestEventsUntil(lambda: not self.com_obj.Pending, timeout)
+
+    async def wait_for_response_async(self, timeout=60) -> bool:
+        """pumps COM messages until the request is no longer pending. sleeps with asyncio.sleep between checks.
+        returns False if still pending after timeout seconds.
+        """
+        return await DoDiagnosticRequestEventsUntilAsync(lambda: not self.com_obj.Pending, timeout)
+
     def set_complex_parameter(self, qualifier, iteration, sub_parameter, value):
         self.com_obj.SetComplexParameter(qualifier, iteration, sub_parameter, value)
 
@@ -2199,6 +2960,7 @@ class CanoeNetworksNetworkDevicesDeviceDiagnosticResponse:
     """The DiagnosticResponse class represents the ECU's reply to a diagnostic request in CANoe.
     The received parameters can be read out and processed.
     """
+    __slots__ = ('com_obj',)
     def __init__(self, diag_res_com_obj):
         self.com_obj = diag_res_com_obj
 
@@ -2212,8 +2974,19 @@ class CanoeNetworksNetworkDevicesDeviceDiagnosticResponse:
 
     @property
     def stream(self) -> str:
-        diag_response_data = " ".join(f"{d:02X}" for d in self.com_obj.Stream).upper()
-        return diag_response_data
+        return self.stream_to_hex(self.com_obj.Stream)
+
+    @staticmethod
+    def stream_to_hex(stream) -> str:
+        # pywin32 returns VT_UI1 arrays as a bytes like buffer. tuples of ints are converted once.
+        if not isinstance(stream, (bytes, bytearray, memoryview)):
+            stream = bytes(stream)
+        return stream.hex(' ').upper()
+
+    def read_stream_sender_positive(self, dispids: dict) -> tuple:
+        """returns (stream, sender, positive) with one IDispatch Invoke per property. dispids is shared between responses."""
+        stream, sender, positive = GetComPropertyValues(self.com_obj, ('Stream', 'Sender', 'Positive'), dispids)
+        return self.stream_to_hex(stream), sender, positive
 
     @property
     def sender(self) -> str:
@@ -2236,6 +3009,7 @@ class CanoeSystem:
     """The System object represents the system of the CANoe application.
     The System object offers access to the namespaces for data exchange with external applications.
     """
+    __slots__ = ('__log', 'com_obj', 'namespaces_com_obj', 'variables_files_com_obj', 'namespaces_dict', 'variables_files_dict', 'variables_dict')
     def __init__(self, system_com_obj):
         try:
             self.__log = logging.getLogger('CANOE_LOG')
@@ -2253,20 +3027,29 @@ class CanoeSystem:
         return self.namespaces_com_obj.Count
 
     def fetch_namespaces(self) -> dict:
-        if self.namespaces_count > 0:
-            for index in range(1, self.namespaces_count + 1):
-                namespace_com_obj = win32com.client.Dispatch(self.namespaces_com_obj.Item(index))
-                namespace_name = namespace_com_obj.Name
-                self.namespaces_dict[namespace_name] = namespace_com_obj
-                if 'Namespaces' in dir(namespace_com_obj):
-                    self.fetch_namespace_namespaces(namespace_com_obj, namespace_name)
-                if 'Variables' in dir(namespace_com_obj):
-                    self.fetch_namespace_variables(namespace_com_obj)
+        self.__fetch_namespaces_tree(self.namespaces_com_obj, '')
         return self.namespaces_dict
 
+    def __fetch_namespaces_tree(self, namespaces_com_obj, parent_namespace_name: str) -> None:
+        # walks the namespace tree with an explicit stack instead of recursion. children are pushed in reverse to keep the depth first order.
+        stack = list()
+        self.__push_namespaces(stack, namespaces_com_obj, parent_namespace_name)
+        while stack:
+            namespace_com_obj, namespace_name = stack.pop()
+            self.namespaces_dict[namespace_name] = namespace_com_obj
+            self.__push_namespaces(stack, namespace_com_obj.Namespaces, namespace_name)
+            self.fetch_namespace_variables(namespace_com_obj)
+
+    @staticmethod
+    def __push_namespaces(stack: list, namespaces_com_obj, parent_namespace_name: str) -> None:
+        for index in range(namespaces_com_obj.Count, 0, -1):
+            namespace_com_obj = win32com.client.Dispatch(namespaces_com_obj.Item(index))
+            namespace_name = f'{parent_namespace_name}::{namespace_com_obj.Name}' if parent_namespace_name else namespace_com_obj.Name
+            stack.append((namespace_com_obj, namespace_name))
+
     def add_namespace(self, name: str):
         self.fetch_namespaces()
-        if name not in self.namespaces_dict.keys():
+        if name not in self.namespaces_dict:
             namespace_com_obj = self.namespaces_com_obj.Add(name)
             self.namespaces_dict[name] = namespace_com_obj
             self.__log.debug(f'➕ Added the new namespace ({name})')
@@ -2277,7 +3060,7 @@ class CanoeSystem:
 
     def remove_namespace(self, name: str) -> None:
         self.fetch_namespaces()
-        if name in self.namespaces_list:
+        if name in self.namespaces_dict:
             self.namespaces_com_obj.Remove(name)
             self.fetch_namespaces()
             self.__log.debug(f'➖ Removed the namespace ({name}) from the collection')
@@ -2289,12 +3072,13 @@ class CanoeSystem:
         return self.variables_files_com_obj.Count
 
     def fetch_variables_files(self):
-        if self.variables_files_count > 0:
-            for index in range(1, self.variables_files_count + 1):
-                variable_file_com_obj = self.variables_files_com_obj.Item(index)
-                self.variables_files_dict[variable_file_com_obj.Name] = {'full_name': variable_file_com_obj.FullName,
-                                                                         'path': variable_file_com_obj.Path,
-                                                                         'index': index}
+        variables_files_com_obj = self.variables_files_com_obj
+        self.variables_files_dict.clear()
+        for index in range(1, variables_files_com_obj.Count + 1):
+            variable_file_com_obj = variables_files_com_obj.Item(index)
+            self.variables_files_dict[variable_file_com_obj.Name] = {'full_name': variable_file_com_obj.FullName,
+                                                                     'path': variable_file_com_obj.Path,
+                                                                     'index': index}
         return self.variables_files_dict
 
     def add_variables_file(self, variables_file: str):
@@ -2316,27 +3100,17 @@ class CanoeSystem:
             self.__log.warning(f'⚠️ The given file ({variables_file_name}) does not exist')
 
     def fetch_namespace_namespaces(self, parent_namespace_com_obj, parent_namespace_name):
-        namespaces_count = parent_namespace_com_obj.Namespaces.Count
-        if namespaces_count > 0:
-            for index in range(1, namespaces_count + 1):
-                namespace_com_obj = win32com.client.Dispatch(parent_namespace_com_obj.Namespaces.Item(index))
-                namespace_name = f'{parent_namespace_name}::{namespace_com_obj.Name}'
-                self.namespaces_dict[namespace_name] = namespace_com_obj
-                if 'Namespaces' in dir(namespace_com_obj):
-                    self.fetch_namespace_namespaces(namespace_com_obj, namespace_name)
-                if 'Variables' in dir(namespace_com_obj):
-                    self.fetch_namespace_variables(namespace_com_obj)
+        self.__fetch_namespaces_tree(parent_namespace_com_obj.Namespaces, parent_namespace_name)
 
     def fetch_namespace_variables(self, parent_namespace_com_obj):
-        variables_count = parent_namespace_com_obj.Variables.Count
-        if variables_count > 0:
-            for index in range(1, variables_count + 1):
-                variable_obj = CanoeSystemVariable(parent_namespace_com_obj.Variables.Item(index))
-                self.variables_dict[variable_obj.full_name] = variable_obj
+        variables_com_obj = parent_namespace_com_obj.Variables
+        for index in range(1, variables_com_obj.Count + 1):
+            variable_obj = CanoeSystemVariable(variables_com_obj.Item(index))
+            self.variables_dict[variable_obj.full_name] = variable_obj
 
     def add_system_variable(self, namespace, variable, value):
         self.fetch_namespaces()
-        if f'{namespace}::{variable}' in self.variables_dict.keys():
+        if f'{namespace}::{variable}' in self.variables_dict:
             self.__log.warning(f'⚠️ The given variable ({variable}) already exists in the namespace ({namespace})')
             return None
         else:
@@ -2345,7 +3119,7 @@ class CanoeSystem:
 
     def remove_system_variable(self, namespace, variable):
         self.fetch_namespaces()
-        if f'{namespace}::{variable}' not in self.variables_dict.keys():
+        if f'{namespace}::{variable}' not in self.variables_dict:
             self.__log.warning(f'⚠️ The given variable ({variable}) already removed in the namespace ({namespace})')
             return None
         else:
@@ -2353,8 +3127,10 @@ class CanoeSystem:
 
 
 class CanoeSystemVariable:
+    __slots__ = ('__log', 'com_obj')
     def __init__(self, variable_com_obj):
         try:
+            self.__log = logging.getLogger('CANOE_LOG')
             self.com_obj = win32com.client.Dispatch(variable_com_obj)
         except Exception as e:
             self.__log.error(f'😡 Error initializing CANoe Variable: {str(e)}')
@@ -2445,10 +3221,10 @@ class CanoeSystemVariable:
         return self.com_obj.GetSymbolicValueName(value)
 
     def set_member_phys_value(self, member_name: str, value):
-        return self.com_obj.setMemberPhysValue(member_name, value)
+        return self.com_obj.SetMemberPhysValue(member_name, value)
 
     def set_member_value(self, member_name: str, value):
-        return self.com_obj.setMemberValue(member_name, value)
+        return self.com_obj.SetMemberValue(member_name, value)
 
     def set_symbolic_value_name(self, value: int, name: str):
-        self.com_obj.setSymbolicValueName(value, name)
+        self.com_obj.SetSymbolicValueName(value, name)
@@ -1,6 +1,8 @@
 # Import Python Libraries here
 import os
 import sys
+import queue
+import atexit
 import logging
 from logging import handlers
 
@@ -9,24 +11,57 @@ class PyCanoeLogger:
     """
     PyCanoeLogger is a class that provides logging functionality for the PyCanoe application.
     Args:
-        py_canoe_log_dir (str): The directory path where the log files will be stored. Defaults to an empty string.
+        py_canoe_log_dir (str): The directory path where the log files will be stored. Defaults to an empty string (PY_CANOE_LOG_DIR environment variable is used if set).
+        console (bool): True to write log messages to stdout. Defaults to True.
     """
+    # listener of the last created logger. handlers of CANOE_LOG are replaced on every instantiation, so the old one is stopped.
+    active_listener = None
 
-    def __init__(self, py_canoe_log_dir='') -> None:
+    def __init__(self, py_canoe_log_dir='', console=True) -> None:
         self.log = logging.getLogger('CANOE_LOG')
+        PyCanoeLogger.stop_active_listener()
         self.log.handlers.clear()
         self.log.propagate = False
-        self.__py_canoe_log_initialization(py_canoe_log_dir)
+        self.listener = None
+        self.__py_canoe_log_initialization(py_canoe_log_dir, console)
 
-    def __py_canoe_log_initialization(self, py_canoe_log_dir):
+    def __py_canoe_log_initialization(self, py_canoe_log_dir, console):
         self.log.setLevel(logging.DEBUG)
         log_format = logging.Formatter("%(asctime)s [CANOE_LOG] [%(levelname)-4.8s] %(message)s")
-        ch = logging.StreamHandler(sys.stdout)
-        ch.setFormatter(log_format)
-        self.log.addHandler(ch)
-        if py_canoe_log_dir != '' and not os.path.exists(py_canoe_log_dir):
-            os.makedirs(py_canoe_log_dir, exist_ok=True)
-        if os.path.exists(py_canoe_log_dir):
-            fh = handlers.RotatingFileHandler(fr'{py_canoe_log_dir}\py_canoe.log', maxBytes=0, encoding='utf-8')
-            fh.setFormatter(log_format)
-            self.log.addHandler(fh)
+        log_handlers = []
+        log_dir_error = None
+        py_canoe_log_dir = py_canoe_log_dir or os.environ.get('PY_CANOE_LOG_DIR', '')
+        if console:
+            ch = logging.StreamHandler(sys.stdout)
+            ch.setFormatter(log_format)
+            log_handlers.append(ch)
+        if py_canoe_log_dir:
+            try:
+                os.makedirs(py_canoe_log_dir, exist_ok=True)
+                # log file is never rotated. plain FileHandler avoids the rollover checks (file stat calls) done for every record.
+                fh = logging.FileHandler(os.path.join(py_canoe_log_dir, 'py_canoe.log'), encoding='utf-8')
+                fh.setFormatter(log_format)
+                log_handlers.append(fh)
+            except OSError as e:
+                log_dir_error = e
+        # stream/file output is written by a background listener thread so logging doesn't block the caller.
+        log_queue = queue.Queue(-1)
+        self.log.addHandler(handlers.QueueHandler(log_queue))
+        self.listener = handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+        self.listener.start()
+        PyCanoeLogger.active_listener = self.listener
+        if log_dir_error is not None:
+            self.log.warning(f'⚠️ not possible to write log file in "{py_canoe_log_dir}". {log_dir_error}')
+
+    @staticmethod
+    def stop_active_listener() -> None:
+        """stops the listener thread after writing all queued log records and closes its handlers."""
+        listener = PyCanoeLogger.active_listener
+        if listener is not None:
+            PyCanoeLogger.active_listener = None
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+
+atexit.register(PyCanoeLogger.stop_active_listener)
@@ -1,4 +1,5 @@
 import os
+import asyncio
 from time import sleep as wait
 from py_canoe import CANoe
 
@@ -40,7 +41,9 @@ class TestPyCanoe:
     def test_meas_start_stop_restart_methods(self):
         self.canoe_inst.open(canoe_cfg=self.canoe_cfg_dev, visible=True, auto_save=False, prompt_user=False)
         assert self.canoe_inst.start_measurement()
+        assert self.canoe_inst.wait_for_measurement_started(timeout=10)
         assert self.canoe_inst.stop_measurement()
+        assert self.canoe_inst.wait_for_measurement_stopped(timeout=10)
         assert self.canoe_inst.start_measurement()
         assert self.canoe_inst.reset_measurement()
         assert self.canoe_inst.get_measurement_running_status()
@@ -81,7 +84,11 @@ class TestPyCanoe:
         self.canoe_inst.get_canoe_version_info()
         assert self.canoe_inst.start_measurement()
         wait(2)
-        self.canoe_inst.get_can_bus_statistics(channel=1)
+        bus_stats = self.canoe_inst.get_can_bus_statistics(channel=1)
+        bus_stats_info = self.canoe_inst.get_can_bus_statistics_info(channel=1)
+        assert bus_stats.keys() == bus_stats_info._asdict().keys()
+        bus_stats_bulk = self.canoe_inst.get_can_bus_statistics_bulk(channels=(1,))
+        assert 1 in bus_stats_bulk
         assert self.canoe_inst.stop_measurement()
 
     def test_bus_signal_methods(self):
@@ -98,8 +105,12 @@ class TestPyCanoe:
         assert self.canoe_inst.check_signal_online(bus='CAN', channel=1, message='LightState', signal='FlashLight')
         self.canoe_inst.check_signal_state(bus='CAN', channel=1, message='LightState', signal='FlashLight')
         sig_val = self.canoe_inst.get_signal_value(bus='CAN', channel=1, message='LightState', signal='FlashLight', raw_value=True)
+        self.canoe_inst.set_signal_values([('CAN', 1, 'LightState', 'FlashLight', 0)], raw_value=True)
+        wait(1)
+        sig_vals = self.canoe_inst.get_signal_values([('CAN', 1, 'LightState', 'FlashLight')], raw_value=True)
         assert self.canoe_inst.stop_measurement()
         assert sig_val == 1
+        assert sig_vals == [0]
 
     def test_ui_class_methods(self):
         self.canoe_inst.open(canoe_cfg=self.canoe_cfg_dev, visible=True, auto_save=False, prompt_user=False, auto_stop=True)
@@ -110,11 +121,14 @@ class TestPyCanoe:
         self.canoe_inst.clear_write_window_content()
         wait(1)
         self.canoe_inst.write_text_in_write_window("hello from py_canoe!")
+        self.canoe_inst.write_text_in_write_window("buffered hello from py_canoe!", buffered=True)
+        self.canoe_inst.flush_write_window()
         wait(1)
         text = self.canoe_inst.read_text_from_write_window()
         assert self.canoe_inst.stop_measurement()
         self.canoe_inst.disable_write_window_output_file()
         assert "hello from py_canoe!" in text
+        assert "buffered hello from py_canoe!" in text
         wait(1)
 
     def test_system_variable_methods(self):
@@ -163,6 +177,11 @@ class TestPyCanoe:
         wait(2)
         resp = self.canoe_inst.send_diag_request('Door', '10 03', return_sender_name=True)
         assert resp['Door'] == '50 03 00 00 00 00'
+        self.canoe_inst.control_tester_present_bulk({'Door': True})
+        wait(2)
+        self.canoe_inst.control_tester_present_bulk({'Door': False})
+        resp = asyncio.run(self.canoe_inst.send_diag_request_async('Door', '10 01'))
+        assert resp == '50 01 00 00 00 00'
         assert self.canoe_inst.stop_measurement()
 
     def test_replay_block_methods(self):
@@ -195,6 +214,7 @@ class TestPyCanoe:
         test_environments = self.canoe_inst.get_test_environments()
         for te_name, _ in test_environments.items():
             self.canoe_inst.execute_all_test_modules_in_test_env(te_name)
+            self.canoe_inst.execute_all_test_modules_in_test_env(te_name, parallel=True)
         self.canoe_inst.execute_test_module('demo_test_node_001')
         self.canoe_inst.execute_test_module('demo_test_node_002')
         wait(1)
@@ -212,6 +232,11 @@ class TestPyCanoe:
         self.canoe_inst.get_environment_variable_value('string_var')
         self.canoe_inst.set_environment_variable_value('data_var', (1, 2, 3, 4, 5, 6, 7))
         self.canoe_inst.get_environment_variable_value('data_var')
+        self.canoe_inst.set_environment_variable_values({'int_var': 12, 'string_var': 'hello'})
+        env_var_values = self.canoe_inst.get_environment_variable_values(('int_var', 'string_var'))
+        assert env_var_values == {'int_var': 12, 'string_var': 'hello'}
+        self.canoe_inst.set_environment_variable_value_from_bytes('data_var', b'\x01\x02\x03\x04\x05\x06\x07')
+        assert self.canoe_inst.get_environment_variable_value_as_bytes('data_var') == b'\x01\x02\x03\x04\x05\x06\x07'
         wait(1)
         assert self.canoe_inst.stop_measurement()
 